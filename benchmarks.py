@@ -0,0 +1,438 @@
+"""
+Reproducible benchmark suite for lookup, export, import and extraction.
+Run with: python benchmarks.py [--sizes 10000 100000] [--compare old.json]
+
+Results are printed and written as JSON (default: bench_output.txt) so runs
+can be diffed; --compare exits non-zero when a metric regresses past the
+tolerance.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+
+import calculator
+import stock_enrichment
+import stock_extractor
+import stock_fuzzy
+import stock_metrics
+import stock_records
+import stock_rollups
+import stock_tags
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CHAT_FILE = os.path.join(BASE_DIR, "_chat 7.txt")
+OUTPUT_FILE = os.path.join(BASE_DIR, "bench_output.txt")
+
+
+def _result(name, value, unit, lower_is_better=True):
+    # lower_is_better=None marks an informational value --compare ignores
+    return {"name": name, "value": value, "unit": unit, "lower_is_better": lower_is_better}
+
+
+def _best_of(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _per_call_ns(func, args, repeat=5):
+    """Best-of-repeat mean cost of func(arg) over args, in nanoseconds."""
+    def run():
+        for arg in args:
+            func(arg)
+    return _best_of(run, repeat) / len(args) * 1e9
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _sample_queries(stocks, count, seed=0):
+    """Realistic mix of names, tickers, lower-case mentions and misses."""
+    rng = random.Random(seed)
+    pool = []
+    for company, tags in stocks.items():
+        pool.append(company)
+        pool.append(company.lower())
+        pool.extend(tag for tag in sorted(tags) if len(stock_enrichment.lookup(tag)) <= 3)
+    pool.extend(["Not A Company", "ZZZZ", "nvidea"])
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def _varied_queries(stocks, count, seed=0):
+    """The same mix, but each query in its own casing and padding (as typed
+    in chat or a spreadsheet), so almost every raw string is distinct."""
+    rng = random.Random(seed)
+    varied = []
+    for query in _sample_queries(stocks, count, seed):
+        cased = "".join(ch.upper() if rng.random() < 0.5 else ch.lower() for ch in query)
+        varied.append(" " * rng.randint(0, 2) + cased + " " * rng.randint(0, 2))
+    return varied
+
+
+# --- Synthetic universes ----------------------------------------------------
+
+def synthetic_universe(size, seed=0):
+    """A {company: tags} dict of `size` companies drawn from the real data.
+
+    Tag-set sizes follow the real distribution, themes are sampled by their
+    real frequency, and every company gets a unique ticker.
+    """
+    rng = random.Random(seed)
+    real = stock_enrichment.ENRICHED_STOCKS
+    set_sizes = [len(tags) for tags in real.values()]
+    frequency = {}
+    for tags in real.values():
+        for tag in tags:
+            frequency[tag] = frequency.get(tag, 0) + 1
+    themes = [tag for tag, count in frequency.items() if count > 1]
+    weights = [frequency[tag] for tag in themes]
+    universe = {}
+    for i in range(size):
+        tags = {f"SYN{i:07d}"}
+        wanted = rng.choice(set_sizes)
+        tags.update(rng.choices(themes, weights, k=max(wanted - 1, 0)))
+        universe[f"Synthetic Company {i}"] = tags
+    return universe
+
+
+@contextmanager
+def use_universe(stocks):
+    """Temporarily point stock_enrichment at another universe."""
+    saved = stock_enrichment.ENRICHED_STOCKS
+    stock_enrichment.ENRICHED_STOCKS = stocks
+    stock_enrichment.rebuild_index()
+    try:
+        yield
+    finally:
+        stock_enrichment.ENRICHED_STOCKS = saved
+        stock_enrichment.rebuild_index()
+
+
+# --- Benchmarks ---------------------------------------------------------------
+
+def bench_get_stock(prefix="", count=2000):
+    """get_stock by exact name, by lower-case ticker, and on a miss."""
+    stocks = stock_enrichment.ENRICHED_STOCKS
+    rng = random.Random(0)
+    names = rng.choices(list(stocks), k=count)
+    # each company's most specific code, so shared themes don't dominate
+    tickers = [min(stocks[name], key=lambda tag: len(stock_enrichment.lookup(tag))).lower()
+               for name in names]
+    misses = [f"missing-{i}" for i in range(count)]
+    get_stock = stock_enrichment.get_stock
+    get_stock(names[0])
+    return [
+        _result(f"{prefix}get_stock.name", _per_call_ns(get_stock, names), "ns/op"),
+        _result(f"{prefix}get_stock.ticker", _per_call_ns(get_stock, tickers), "ns/op"),
+        _result(f"{prefix}get_stock.miss", _per_call_ns(get_stock, misses), "ns/op"),
+    ]
+
+
+def bench_exports(prefix=""):
+    """to_json and the display text, uncached and (for display) cached."""
+    def display_uncached():
+        stock_enrichment._DISPLAY_CACHE = (None, None)
+        stock_enrichment.format_stocks()
+
+    results = [
+        _result(f"{prefix}to_json", _best_of(stock_enrichment.to_json) * 1e3, "ms"),
+        _result(f"{prefix}display_stocks.uncached", _best_of(display_uncached) * 1e3, "ms"),
+    ]
+    stock_enrichment.format_stocks()
+    results.append(_result(f"{prefix}display_stocks.cached",
+                           _per_call_ns(lambda _: stock_enrichment.format_stocks(), range(1000)), "ns/op"))
+    return results
+
+
+def bench_resolve_many(prefix="", count=50000):
+    """resolve_many against a get_stock loop memoised on the raw query.
+
+    Two samples: one that repeats queries heavily, where both sides mostly
+    skip repeats, and a varied one where nearly every raw string is
+    distinct but many normalise to the same key. The distinct-query ratio
+    of each is reported alongside (informational, not compared).
+    """
+    get_stock = stock_enrichment.get_stock
+    results = []
+    for label, queries in (("", _sample_queries(stock_enrichment.ENRICHED_STOCKS, count)),
+                           (".varied", _varied_queries(stock_enrichment.ENRICHED_STOCKS, count))):
+        def memoised_loop():
+            cache = {}
+            for query in queries:
+                if query not in cache:
+                    cache[query] = get_stock(query.strip())
+
+        loop = _best_of(memoised_loop, 3)
+        bulk = _best_of(lambda: stock_enrichment.resolve_many(queries), 3)
+        results += [
+            _result(f"{prefix}get_stock.memoised_loop{label}", count / loop, "queries/s", lower_is_better=False),
+            _result(f"{prefix}resolve_many{label}", count / bulk, "queries/s", lower_is_better=False),
+            _result(f"{prefix}resolve_many{label}.distinct_ratio", len(set(queries)) / count, "ratio",
+                    lower_is_better=None),
+        ]
+    return results
+
+
+def bench_tag_query(prefix=""):
+    """Build a TagIndex and run an AND/NOT query on it."""
+    build = _best_of(lambda: stock_tags.TagIndex(stock_enrichment.ENRICHED_STOCKS), 3)
+    index = stock_tags.TagIndex(stock_enrichment.ENRICHED_STOCKS)
+    query = _per_call_ns(lambda _: index.count(["Uranium", "Mining"], none_of=["Canada"]), range(1000))
+    return [
+        _result(f"{prefix}tag_index.build", build * 1e3, "ms"),
+        _result(f"{prefix}tag_index.query", query, "ns/op"),
+    ]
+
+
+def bench_fuzzy_lookup(count=2000, seed=0):
+    """Per-query latency of fuzzy_lookup on misspelt names (index prebuilt)."""
+    rng = random.Random(seed)
+    names = list(stock_enrichment.ENRICHED_STOCKS)
+    queries = []
+    for _ in range(count):
+        name = list(rng.choice(names))
+        i = rng.randrange(len(name))
+        name[i] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+        queries.append("".join(name))
+    stock_fuzzy.get_index()
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        stock_fuzzy.fuzzy_lookup(query)
+        samples.append(time.perf_counter() - start)
+    return [
+        _result("fuzzy_lookup.p50", _percentile(samples, 50) * 1e6, "us"),
+        _result("fuzzy_lookup.p99", _percentile(samples, 99) * 1e6, "us"),
+    ]
+
+
+_IMPORT_PROBE = (
+    "import time; t = time.perf_counter(); {stmt}; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def _import_seconds(stmt, runs):
+    """Median wall time of stmt in fresh interpreters (bytecode caching on)."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    code = _IMPORT_PROBE.format(stmt=stmt)
+    subprocess.run([sys.executable, "-c", code], env=env, cwd=BASE_DIR, check=True, capture_output=True)
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], env=env, cwd=BASE_DIR,
+                             check=True, capture_output=True, text=True).stdout
+        samples.append(float(out))
+    return statistics.median(samples)
+
+
+def bench_import_time(runs=20):
+    """Cold-start cost of the data literal vs deferring it until first access."""
+    return [
+        _result("import.eager_literal", _import_seconds("import stock_data", runs) * 1e3, "ms"),
+        _result("import.stock_enrichment", _import_seconds("import stock_enrichment", runs) * 1e3, "ms"),
+        _result("import.stock_enrichment+load", _import_seconds(
+            "import stock_enrichment; len(stock_enrichment.ENRICHED_STOCKS)", runs) * 1e3, "ms"),
+    ]
+
+
+def bench_parallel_extraction(copies=8, max_workers=None):
+    """Sharded extraction throughput and speedup for 1, 2, 4, ... workers."""
+    max_workers = max_workers or os.cpu_count() or 1
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "chat.txt")
+        with open(path, "wb") as out:
+            for _ in range(copies):
+                with open(CHAT_FILE, "rb") as src:
+                    shutil.copyfileobj(src, out)
+        size_mb = os.path.getsize(path) / 1e6
+        workers, baseline = 1, None
+        while workers <= max_workers:
+            elapsed = _best_of(lambda: stock_extractor.extract_parallel(path, workers), 1)
+            baseline = baseline or elapsed
+            results.append(_result(f"extract.workers_{workers}", size_mb / elapsed, "MB/s",
+                                   lower_is_better=False))
+            results.append(_result(f"extract.workers_{workers}.efficiency",
+                                   baseline / elapsed / workers, "ratio", lower_is_better=False))
+            workers *= 2
+    return results
+
+
+def bench_calculator(size=1_000_000):
+    """Batched array helpers against the scalar per-position loop."""
+    rng = random.Random(0)
+    prices = [rng.uniform(1, 500) for _ in range(size)]
+    divisors = [rng.choice((0, 1, 2, 4)) for _ in range(size)]
+    batch = calculator.as_array(prices)
+    chunks = [batch[i:i + 65536] for i in range(0, size, 65536)]
+
+    def scalar_divide():
+        for a, b in zip(prices, divisors):
+            if b:
+                calculator.divide_numbers(a, b)
+
+    def stream():
+        running = calculator.RunningMean()
+        for chunk in chunks:
+            running.update(chunk)
+
+    mvals = size / 1e6
+    return [
+        _result("calculator.get_average", mvals / _best_of(lambda: calculator.get_average(prices), 3),
+                "Mvalues/s", lower_is_better=False),
+        _result("calculator.average_array", mvals / _best_of(lambda: calculator.average_array(batch), 3),
+                "Mvalues/s", lower_is_better=False),
+        _result("calculator.running_mean", mvals / _best_of(stream, 3), "Mvalues/s", lower_is_better=False),
+        _result("calculator.divide_numbers.loop", mvals / _best_of(scalar_divide, 3),
+                "Mvalues/s", lower_is_better=False),
+        _result("calculator.divide_arrays", mvals / _best_of(lambda: calculator.divide_arrays(batch, divisors), 3),
+                "Mvalues/s", lower_is_better=False),
+        _result("calculator.discount_array", mvals / _best_of(lambda: calculator.discount_array(batch, 15), 3),
+                "Mvalues/s", lower_is_better=False),
+    ]
+
+
+def bench_rollups():
+    """Cached rollup queries and API routes against a full rescan per query."""
+    rollups = stock_rollups.get_rollups()
+    company = next(iter(stock_enrichment.ENRICHED_STOCKS))
+    tags = set(stock_enrichment.ENRICHED_STOCKS[company])
+
+    def edit(_):
+        stock_enrichment.set_stock(company, tags | {"Uranium"})
+        stock_enrichment.set_stock(company, tags)
+
+    server = stock_rollups.ThreadingHTTPServer(("127.0.0.1", 0), stock_rollups.RollupHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/categories/energy"
+    try:
+        http = _per_call_ns(lambda _: urllib.request.urlopen(url).read(), range(200), 3)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return [
+        _result("rollups.full_scan", _best_of(stock_rollups.full_scan, 5) * 1e3, "ms"),
+        _result("rollups.build", _best_of(lambda: stock_rollups.Rollups(stock_records.get_store()), 5) * 1e3, "ms"),
+        _result("rollups.companies_in", _per_call_ns(rollups.companies_in, ["energy"] * 1000), "ns/op"),
+        _result("rollups.summary", _per_call_ns(lambda _: rollups.summary(), range(1000)) / 1e3, "us"),
+        _result("rollups.route", _per_call_ns(stock_rollups.route, ["/categories/energy"] * 1000) / 1e3, "us"),
+        _result("rollups.http", http / 1e3, "us"),
+        _result("rollups.incremental_edit", _per_call_ns(edit, range(200)) / 2e3, "us"),
+    ]
+
+
+def bench_scaled(sizes):
+    """Lookup, export and tag-index costs on synthetic universes."""
+    results = []
+    for size in sizes:
+        stocks = synthetic_universe(size)
+        prefix = f"synthetic_{size}."
+        with use_universe(stocks):
+            start = time.perf_counter()
+            stock_enrichment.rebuild_index()
+            results.append(_result(f"{prefix}index.build", (time.perf_counter() - start) * 1e3, "ms"))
+            results += bench_get_stock(prefix)
+            results.append(_result(f"{prefix}to_json", _best_of(stock_enrichment.to_json, 1) * 1e3, "ms"))
+            results += bench_resolve_many(prefix, count=min(size, 50000))
+            results += bench_tag_query(prefix)
+    return results
+
+
+# --- Runner -----------------------------------------------------------------
+
+SUITES = {
+    "lookup": lambda args: bench_get_stock() + bench_resolve_many(),
+    "export": lambda args: bench_exports(),
+    "tags": lambda args: bench_tag_query(),
+    "fuzzy": lambda args: bench_fuzzy_lookup(),
+    "import": lambda args: bench_import_time(),
+    "extract": lambda args: bench_parallel_extraction(args.copies),
+    "calculator": lambda args: bench_calculator(),
+    "rollups": lambda args: bench_rollups(),
+    "scaled": lambda args: bench_scaled(args.sizes),
+}
+
+
+def compare(results, baseline_path, tolerance):
+    """Return (name, old, new) for every metric worse than baseline by > tolerance."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {r["name"]: r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        old = baseline.get(result["name"])
+        if old is None or not old["value"] or result["lower_is_better"] is None:
+            continue
+        change = result["value"] / old["value"] - 1
+        if not result["lower_is_better"]:
+            change = -change
+        if change > tolerance:
+            regressions.append((result["name"], old["value"], result["value"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stock hot-path benchmark suite.")
+    parser.add_argument("--only", nargs="+", choices=sorted(SUITES), help="suites to run")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10000, 100000],
+                        help="synthetic universe sizes (up to 1000000)")
+    parser.add_argument("--copies", type=int, default=8, help="chat file copies for extraction")
+    parser.add_argument("--output", default=OUTPUT_FILE, help="where to write JSON results")
+    parser.add_argument("--compare", help="baseline JSON from a previous run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed regression (0.25 = 25%%)")
+    parser.add_argument("--metrics", action="store_true", help="time the hot paths and add a metrics section (or set STOCK_METRICS=1)")
+    args = parser.parse_args(argv)
+    if args.metrics:
+        stock_metrics.enable()
+    else:
+        stock_metrics.init()
+
+    results = []
+    for name in args.only or SUITES:
+        for result in SUITES[name](args):
+            print(f"{result['name']:45} {result['value']:>14,.2f} {result['unit']}")
+            results.append(result)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "stocks": len(stock_enrichment.ENRICHED_STOCKS),
+        "results": results,
+    }
+    if stock_metrics.enabled():
+        report["metrics"] = stock_metrics.snapshot()
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for name, old, new in regressions:
+            print(f"REGRESSION {name}: {old:,.2f} -> {new:,.2f}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
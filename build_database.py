@@ -0,0 +1,196 @@
+"""
+Build pipeline for stock_database/processed and stock_database/exports.
+Generates every output described in stock_database/README.md from
+ENRICHED_STOCKS, stock_symbols.json and metadata/categories.json.
+
+Content hashes of the inputs and of every written file are kept in
+processed/.build_manifest.json, so a rerun skips outputs whose inputs did not
+change and never rewrites a file whose content is unchanged.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import stock_enrichment
+import stock_records
+
+DATABASE_DIR = os.path.join(stock_records.BASE_DIR, "stock_database")
+PROCESSED_DIR = os.path.join(DATABASE_DIR, "processed")
+MANIFEST_FILE = os.path.join(PROCESSED_DIR, ".build_manifest.json")
+
+
+def _digest(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_digest(path):
+    with open(path, "rb") as f:
+        return _digest(f.read())
+
+
+def _dump_json(data):
+    return json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+
+def input_digests(stocks=None):
+    """Content hash of each pipeline input."""
+    if stocks is None:
+        stocks = stock_enrichment.ENRICHED_STOCKS
+    canonical = json.dumps({name: sorted(tags) for name, tags in stocks.items()},
+                           sort_keys=True, ensure_ascii=False)
+    return {
+        "stocks": _digest(canonical),
+        "symbols": _file_digest(stock_enrichment.SYMBOLS_FILE),
+        "categories": _file_digest(stock_records.CATEGORIES_FILE),
+    }
+
+
+# Builders take the build context and return {path relative to stock_database: text}
+
+def build_enriched(ctx):
+    return {"processed/enriched_stocks.json": _dump_json(ctx["records"])}
+
+
+def build_by_category(ctx):
+    with open(stock_records.CATEGORIES_FILE, encoding="utf-8") as f:
+        categories = json.load(f)["categories"]
+    grouped = {key: [] for key in categories}
+    grouped["other"] = []
+    for record in ctx["records"]:
+        for key in record["categories"] or ["other"]:
+            grouped[key].append(record)
+    files = {}
+    for key, records in grouped.items():
+        name = categories[key]["name"] if key in categories else "Other"
+        files[f"processed/stocks_by_category/{key}.json"] = _dump_json(
+            {"category": key, "name": name, "count": len(records), "stocks": records})
+    return files
+
+
+def build_by_exchange(ctx):
+    grouped = {}
+    for record in ctx["records"]:
+        grouped.setdefault(record.get("exchange", "UNKNOWN"), []).append(
+            {"company_name": record["company_name"], "ticker": record["ticker"]})
+    return {"processed/stocks_by_exchange.json": _dump_json(dict(sorted(grouped.items())))}
+
+
+def build_json_export(ctx):
+    return {"exports/all_stocks.json": _dump_json(ctx["records"])}
+
+
+def build_csv_export(ctx):
+    return {"exports/all_stocks.csv": stock_records.render_csv(ctx["records"])}
+
+
+def build_py_export(ctx):
+    lines = ['"""', "Generated by build_database.py - do not edit.", '"""', "", "ENRICHED_STOCKS = {"]
+    for name, tags in ctx["stocks"].items():
+        lines.append(f"    {name!r}: {{{', '.join(repr(t) for t in sorted(tags))}}},")
+    lines.append("}")
+    return {"exports/all_stocks.py": "\n".join(lines) + "\n"}
+
+
+# output name -> (inputs it depends on, builder)
+OUTPUTS = {
+    "enriched_stocks": (("stocks", "symbols", "categories"), build_enriched),
+    "stocks_by_category": (("stocks", "symbols", "categories"), build_by_category),
+    "stocks_by_exchange": (("stocks", "symbols", "categories"), build_by_exchange),
+    "all_stocks_json": (("stocks", "symbols", "categories"), build_json_export),
+    "all_stocks_csv": (("stocks", "symbols", "categories"), build_csv_export),
+    "all_stocks_py": (("stocks",), build_py_export),
+}
+
+
+def load_manifest(path=MANIFEST_FILE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _up_to_date(entry, inputs):
+    if not entry or entry.get("inputs") != inputs:
+        return False
+    for rel, digest in entry.get("files", {}).items():
+        path = os.path.join(DATABASE_DIR, rel)
+        if not os.path.exists(path) or _file_digest(path) != digest:
+            return False
+    return True
+
+
+def _write_files(files, previous, force=False):
+    """Write only files whose content changed; return (digests, written paths)."""
+    digests, written = {}, []
+    for rel, text in files.items():
+        digest = _digest(text)
+        digests[rel] = digest
+        path = os.path.join(DATABASE_DIR, rel)
+        if not force and previous.get(rel) == digest and os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        os.replace(tmp, path)
+        written.append(rel)
+    for rel in set(previous) - set(digests):
+        path = os.path.join(DATABASE_DIR, rel)
+        if os.path.exists(path):
+            os.remove(path)
+    return digests, written
+
+
+def build(force=False, stocks=None):
+    """Regenerate stale outputs; return {output name: written paths}.
+
+    Builders run one after another: they are CPU-bound and would only
+    contend for the GIL on threads.
+    """
+    if stocks is None:
+        stocks = stock_enrichment.ENRICHED_STOCKS
+    digests = input_digests(stocks)
+    manifest = load_manifest()
+    todo = {}
+    for name, (deps, builder) in OUTPUTS.items():
+        inputs = {dep: digests[dep] for dep in deps}
+        if force or not _up_to_date(manifest.get(name), inputs):
+            todo[name] = (inputs, builder)
+    if not todo:
+        return {}
+
+    ctx = {"stocks": stocks, "records": stock_records.RecordStore(stocks).to_list()}
+
+    results = {}
+    for name, (inputs, builder) in todo.items():
+        previous = manifest.get(name, {}).get("files", {})
+        files, written = _write_files(builder(ctx), previous, force)
+        manifest[name] = {"inputs": inputs, "files": files}
+        results[name] = written
+
+    os.makedirs(PROCESSED_DIR, exist_ok=True)
+    with open(MANIFEST_FILE, "w", encoding="utf-8") as f:
+        f.write(_dump_json(manifest))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build stock_database processed data and exports.")
+    parser.add_argument("--force", action="store_true", help="rebuild every output")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = build(force=args.force)
+    elapsed = time.perf_counter() - start
+    if not results:
+        print(f"All outputs up to date ({elapsed * 1000:.1f} ms)")
+    for name, written in results.items():
+        print(f"{name}: {len(written)} file(s) written")
+    if results:
+        print(f"Done in {elapsed * 1000:.1f} ms")
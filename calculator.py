@@ -2,6 +2,16 @@
 Simple calculator module with utility functions
 """
 
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the array helpers fall back to array("d")
+    np = None
+
+NAN = float("nan")
+
+
 def divide_numbers(a, b):
     """Divide two numbers"""
     if b == 0:
@@ -10,8 +20,10 @@ def divide_numbers(a, b):
 
 def get_average(numbers):
     """Calculate average of a list of numbers"""
+    if len(numbers) == 0:
+        raise ValueError("Cannot average an empty sequence")
     total = sum(numbers)
-    return total / len(numbers)  # Bug: will crash if numbers is empty
+    return total / len(numbers)
 
 def find_element(arr, index):
     """Get element at index from array"""
@@ -28,3 +40,192 @@ def calculate_discount(price, discount_percent):
     """Calculate discounted price"""
     discount = price * discount_percent / 100
     return price - discount
+
+
+# --- Array helpers ------------------------------------------------------------
+# Batched variants of the helpers above for large baskets of positions. They
+# accept NumPy arrays, lists, or buffers of float64 (array.array("d"), bytes,
+# memoryview) and use NumPy when it is installed, falling back to array("d").
+
+
+def as_array(values):
+    """Float64 array view of values, without copying when it already is one."""
+    if np is not None:
+        if isinstance(values, (bytes, bytearray, memoryview)):
+            return np.frombuffer(values, dtype=np.float64)
+        return np.asarray(values, dtype=np.float64)
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        return array("d", memoryview(values).cast("B").cast("d"))
+    if isinstance(values, (int, float)):
+        return array("d", [values])
+    return array("d", values)
+
+
+def _seq(values):
+    # the pure-Python fallback iterates lists directly rather than copying them
+    return values if isinstance(values, (list, tuple, array)) else as_array(values)
+
+
+def _pairs(a, b):
+    """Broadcast a scalar against a sequence for the pure-Python fallback."""
+    a_scalar, b_scalar = isinstance(a, (int, float)), isinstance(b, (int, float))
+    if a_scalar and b_scalar:
+        return [a], [b]
+    if a_scalar:
+        b = _seq(b)
+        return [a] * len(b), b
+    if b_scalar:
+        a = _seq(a)
+        return a, [b] * len(a)
+    a, b = _seq(a), _seq(b)
+    if len(a) != len(b):
+        raise ValueError(f"Shape mismatch: {len(a)} vs {len(b)} values")
+    return a, b
+
+
+def divide_arrays(a, b, on_zero="nan"):
+    """Element-wise a / b.
+
+    on_zero decides what a zero divisor produces: "nan" (default), "raise"
+    for divide_numbers' ValueError, or a number to fill in.
+    """
+    if on_zero == "nan":
+        fill = NAN
+    elif on_zero == "raise":
+        fill = None
+    else:
+        fill = float(on_zero)
+    if np is not None:
+        a, b = as_array(a), as_array(b)
+        zero = b == 0
+        if fill is None and zero.any():
+            raise ValueError("Cannot divide by zero")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = np.divide(a, b)
+        if zero.any():
+            result = np.where(zero, fill, result)
+        return result
+    a, b = _pairs(a, b)
+    if fill is None and 0 in b:
+        raise ValueError("Cannot divide by zero")
+    if fill is None or 0 not in b:
+        return array("d", [x / y for x, y in zip(a, b)])
+    return array("d", [x / y if y else fill for x, y in zip(a, b)])
+
+
+def zero_divisor_mask(b):
+    """True where b is zero, for callers that want to mask instead of fill."""
+    if np is not None:
+        return as_array(b) == 0
+    return [x == 0 for x in as_array(b)]
+
+
+def _count(values):
+    # .size rather than len() so a 0-d NumPy array (from a bare number) counts
+    # as one value, as the array("d") fallback already does
+    return values.size if np is not None else len(values)
+
+
+def average_array(values, empty=NAN):
+    """Mean of values; returns `empty` (NaN by default) for empty input.
+
+    Pass empty="raise" to get a ValueError instead. A bare number is
+    treated as a single value.
+    """
+    values = as_array(values) if np is not None else _seq(values)
+    if _count(values) == 0:
+        if empty == "raise":
+            raise ValueError("Cannot average an empty sequence")
+        return empty
+    if np is not None:
+        return float(values.mean())
+    return sum(values) / len(values)
+
+
+def discount_array(prices, discount_percent):
+    """Discounted prices; discount_percent may be a scalar or one per price."""
+    if np is not None:
+        prices = as_array(prices)
+        return prices - prices * as_array(discount_percent) / 100
+    prices, discounts = _pairs(prices, discount_percent)
+    return array("d", [p - p * d / 100 for p, d in zip(prices, discounts)])
+
+
+class RunningMean:
+    """Streaming mean and variance (Welford), for data that doesn't fit in memory.
+
+    add() takes one value; update() folds in a whole chunk at once, so feeding
+    arrays chunk by chunk stays close to batched speed.
+    """
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self, values=None):
+        self.count = 0
+        self.mean = NAN
+        self._m2 = 0.0
+        if values is not None:
+            self.update(values)
+
+    def __repr__(self):
+        return f"RunningMean(count={self.count}, mean={self.mean})"
+
+    def add(self, value):
+        self.count += 1
+        if self.count == 1:
+            self.mean = float(value)
+            return
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def _combine(self, count, mean, m2):
+        # Chan et al. pairwise update
+        if count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = count, mean, m2
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def update(self, values):
+        """Fold a chunk of values into the running totals."""
+        values = as_array(values) if np is not None else _seq(values)
+        count = _count(values)
+        if count == 0:
+            return
+        if np is not None:
+            mean = float(values.mean())
+            m2 = float(((values - mean) ** 2).sum())
+        else:
+            mean = sum(values) / count
+            m2 = sum([(x - mean) * (x - mean) for x in values])
+        self._combine(count, mean, m2)
+
+    def merge(self, other):
+        """Fold in another RunningMean (e.g. from a different shard)."""
+        self._combine(other.count, other.mean, other._m2)
+        return self
+
+    @property
+    def variance(self):
+        """Population variance; NaN until there is at least one value."""
+        return self._m2 / self.count if self.count else NAN
+
+
+def stream_average(chunks, empty=NAN):
+    """Mean over an iterable of chunks without holding them all in memory."""
+    running = RunningMean()
+    for chunk in chunks:
+        running.update(chunk)
+    if running.count == 0:
+        if empty == "raise":
+            raise ValueError("Cannot average an empty sequence")
+        return empty
+    return running.mean
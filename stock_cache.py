@@ -0,0 +1,83 @@
+"""
+Cached serialisation of the full enriched dataset.
+Canonical JSON, CSV and display payloads are rendered once per dataset version
+and served as bytes with an ETag, so repeated full-universe responses do no
+re-rendering work.
+"""
+
+import hashlib
+import json
+import threading
+from collections import namedtuple
+
+import stock_enrichment
+import stock_records
+
+Payload = namedtuple("Payload", ["body", "etag", "version", "content_type"])
+
+CONTENT_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv; charset=utf-8",
+    "display": "text/plain; charset=utf-8",
+}
+
+
+def _render_json():
+    data = {name: sorted(tags) for name, tags in sorted(stock_enrichment.ENRICHED_STOCKS.items())}
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _render_csv():
+    return stock_records.render_csv(stock_records.get_store().to_list()).encode("utf-8")
+
+
+def _render_display():
+    return stock_enrichment.format_stocks().encode("utf-8")
+
+
+RENDERERS = {
+    "json": _render_json,
+    "csv": _render_csv,
+    "display": _render_display,
+}
+
+_CACHE = {}   # format -> Payload
+_LOCK = threading.Lock()
+
+
+def get_payload(fmt="json"):
+    """Cached Payload for a format, re-rendered only after the dataset changes."""
+    if fmt not in RENDERERS:
+        raise ValueError(f"Unknown format: {fmt!r} (expected one of {sorted(RENDERERS)})")
+    version = stock_enrichment.dataset_version()
+    payload = _CACHE.get(fmt)
+    if payload is not None and payload.version == version:
+        return payload
+    with _LOCK:
+        payload = _CACHE.get(fmt)
+        if payload is None or payload.version != version:
+            import stock_metrics  # not at module level: stock_metrics.enable() imports this module
+
+            stock_metrics.incr(f"stock_cache.render.{fmt}")
+            body = RENDERERS[fmt]()
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+            payload = Payload(body, etag, version, CONTENT_TYPES[fmt])
+            _CACHE[fmt] = payload
+    return payload
+
+
+def not_modified(fmt, if_none_match):
+    """True when a client's If-None-Match header still matches the cached ETag."""
+    return if_none_match == get_payload(fmt).etag
+
+
+def invalidate():
+    """Drop every cached payload after ENRICHED_STOCKS was edited directly.
+
+    Calls stock_enrichment.touch(), which bumps the dataset version (expiring
+    the display text cache) and resets every shared cache: the RecordStore
+    the CSV is rendered from, TagIndex, FuzzyIndex and Rollups.
+    """
+    with _LOCK:
+        stock_enrichment.touch()
+        _CACHE.clear()
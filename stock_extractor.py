@@ -0,0 +1,347 @@
+"""
+Stock mention extraction from raw chat text.
+Scans text in one pass with an Aho-Corasick automaton built from every company
+name, ticker and keyword in ENRICHED_STOCKS.
+"""
+
+import argparse
+import json
+import os
+import re
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import stock_enrichment
+import stock_records
+
+# offset is the character offset of the match from the start of the stream
+Mention = namedtuple("Mention", ["company", "alias", "offset"])
+
+# Codes that are everyday words or acronyms in chat ("the EU", "pre IPO",
+# "U-turn"); they only count as a $cashtag
+CASHTAG_ONLY = {"AM", "AV", "DRC", "EU", "GOLD", "IPO", "M&A", "MP", "NATO", "U", "V"}
+
+# Company names that are ordinary words ("apple pie", "zoom call"); they only
+# count when capitalised
+COMMON_WORD_NAMES = {
+    "Admiral", "Alphabet", "Apple", "Axon", "Block", "Boohoo", "Direct Line", "Helium",
+    "Intel", "Lemonade", "Lucid", "Meta", "Snowflake", "Uber", "Visa", "Yellow Cake", "Zoom",
+}
+
+# How a pattern must appear in the text to count
+CODE = "code"                # as written, or as a $cashtag in any case
+CASHTAG = "cashtag"          # only as a $cashtag
+CAPITALISED = "capitalised"  # first letter upper-case
+ANY_CASE = None
+
+
+def _fold(ch):
+    """Lower-case a single character without changing the text length."""
+    low = ch.lower()
+    return low if len(low) == 1 else ch
+
+
+def _mode(alias):
+    if alias in CASHTAG_ONLY:
+        return CASHTAG
+    if alias.upper() == alias:  # ticker-style: AMZN, 0R1O, BRK.B
+        return CODE
+    if alias in COMMON_WORD_NAMES:
+        return CAPITALISED
+    return ANY_CASE
+
+
+def _is_generic(alias):
+    """Plain one-word keywords ("Power", "Silver", "Value") describe a theme,
+    not a company; multi-word and internally capitalised ones (YouTube,
+    iPhone, "Nuclear Fuel") are specific enough to count."""
+    return " " not in alias and alias[1:].islower()
+
+
+def _joined(text, i, step):
+    """True if text[i] continues the word at a match edge: a letter/digit, or
+    a dot inside a dotted token ("U" in "U.S.", "BRK" in "BRK.B")."""
+    ch = text[i]
+    if ch.isalnum():
+        return True
+    j = i + step
+    return ch == "." and 0 <= j < len(text) and text[j].isalnum()
+
+
+class StockMatcher:
+    """Aho-Corasick automaton over stock aliases.
+
+    Names and keywords match case-insensitively, except names that are
+    ordinary words (COMMON_WORD_NAMES), which must be capitalised.
+    Ticker-style codes match case-sensitively unless written as a cashtag
+    ($tsla), and codes that are common words (CASHTAG_ONLY: "EU", "IPO")
+    only match as a cashtag. Matches must sit
+    on word boundaries, so "EV" does not fire inside "EVENT", and a match
+    inside a longer one ("U" in "U.U") is dropped. Tags carried by several
+    companies ("AI", "Mining"), the category/geographic tags from
+    metadata/categories.json and plain one-word keywords are themes rather
+    than names and never count as a mention.
+    """
+
+    def __init__(self, stocks=None):
+        if stocks is None:
+            stocks = stock_enrichment.ENRICHED_STOCKS
+        names = {company.upper() for company in stocks}
+        tag_categories, geographic, _ = stock_records.load_taxonomy()
+        owners = {}
+        for company, tags in stocks.items():
+            owners.setdefault(company, set()).add(company)
+            for tag in tags:
+                key = tag.upper()
+                # another company's name is that company's alias, not this one's
+                if key in names or key in tag_categories or key in geographic or _is_generic(tag):
+                    continue
+                owners.setdefault(tag, set()).add(company)
+        # pattern id -> (alias, company, mode)
+        self.patterns = [(alias, next(iter(companies)), _mode(alias))
+                         for alias, companies in owners.items() if len(companies) == 1]
+        self._goto = [{}]
+        self._out = [()]
+        for pid, (alias, _, _) in enumerate(self.patterns):
+            state = 0
+            for ch in alias:
+                ch = _fold(ch)
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (pid,)
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def _matches(self, text):
+        """(start, end, pattern id) for every alias on word boundaries."""
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        size = len(text)
+        state = 0
+        found = []
+        for i, ch in enumerate(text):
+            ch = _fold(ch)
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            for pid in out[state]:
+                alias, _, mode = patterns[pid]
+                start = end - len(alias)
+                if alias[-1].isalnum() and end < size and _joined(text, end, 1):
+                    continue
+                if alias[0].isalnum() and start > 0 and _joined(text, start - 1, -1):
+                    continue
+                if mode is not ANY_CASE:
+                    if mode is CAPITALISED:
+                        if not text[start].isupper():
+                            continue
+                    elif start == 0 or text[start - 1] != "$":
+                        if mode is CASHTAG or text[start:end] != alias:
+                            continue
+                found.append((start, end, pid))
+        return found
+
+    def scan(self, text, base=0):
+        """Yield a Mention for every alias matched in text, longest match winning."""
+        found = self._matches(text)
+        if not found:
+            return
+        if len(found) > 1:
+            found.sort(key=lambda m: (m[0] - m[1], m[0]))
+            taken, kept = set(), []
+            for start, end, pid in found:
+                span = range(start, end)
+                if taken.isdisjoint(span):
+                    taken.update(span)
+                    kept.append((start, end, pid))
+            found = sorted(kept)
+        patterns = self.patterns
+        for start, _, pid in found:
+            alias, company, _ = patterns[pid]
+            yield Mention(company, alias, base + start)
+
+
+def extract_mentions(lines, matcher=None):
+    """Stream Mentions from an iterable of text lines.
+
+    Lines are scanned one at a time, so memory use is bounded by the longest
+    line rather than the input size.
+    """
+    if matcher is None:
+        matcher = StockMatcher()
+    offset = 0
+    for line in lines:
+        yield from matcher.scan(line, offset)
+        offset += len(line)
+
+
+def extract_file(path, matcher=None):
+    """Stream Mentions from a chat export on disk."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        yield from extract_mentions(f, matcher)
+
+
+def count_mentions(mentions):
+    """Count Mentions per company."""
+    return Counter(mention.company for mention in mentions)
+
+
+# --- Sharded multi-process extraction -------------------------------------
+
+MENTION_STATS_FILE = os.path.join(stock_enrichment.BASE_DIR, "stock_database", "processed",
+                                  "chat_mentions.json")
+
+# WhatsApp export header: optional LRM, then "[31/10/2024, 15:31:23]"
+_TIMESTAMP = re.compile(r"^\u200e?\[(\d{2})/(\d{2})/(\d{4}), (\d{2}:\d{2}:\d{2})\]")
+
+
+def split_ranges(path, shards):
+    """Split a file into up to `shards` byte ranges that start and end on line boundaries."""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, shards):
+            f.seek(max(size * i // shards, bounds[-1]))
+            f.readline()
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+
+def _timestamp(line):
+    match = _TIMESTAMP.match(line)
+    if match is None:
+        return None
+    day, month, year, clock = match.groups()
+    return f"{year}-{month}-{day}T{clock}"
+
+
+def scan_range(matcher, path, start, end):
+    """Mention stats for one byte range: {company: [count, first_seen, last_seen]}.
+
+    Continuation lines of a multi-line message inherit the last header's
+    timestamp; lines before the first header in a shard have none.
+    """
+    stats = {}
+    current = None
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        while pos < end:
+            raw = f.readline()
+            if not raw:
+                break
+            pos += len(raw)
+            line = raw.decode("utf-8", errors="replace")
+            current = _timestamp(line) or current
+            for mention in matcher.scan(line):
+                entry = stats.get(mention.company)
+                if entry is None:
+                    stats[mention.company] = [1, current, current]
+                    continue
+                entry[0] += 1
+                if current is not None:
+                    if entry[1] is None or current < entry[1]:
+                        entry[1] = current
+                    if entry[2] is None or current > entry[2]:
+                        entry[2] = current
+    return stats
+
+
+def merge_stats(total, stats):
+    """Fold one shard's stats into a running total (in place)."""
+    for company, (count, first, last) in stats.items():
+        entry = total.get(company)
+        if entry is None:
+            total[company] = [count, first, last]
+            continue
+        entry[0] += count
+        if first is not None and (entry[1] is None or first < entry[1]):
+            entry[1] = first
+        if last is not None and (entry[2] is None or last > entry[2]):
+            entry[2] = last
+    return total
+
+
+_WORKER_MATCHER = None
+
+
+def _init_worker(stocks):
+    # Runs once per process: the automaton is built here, not shipped per task
+    global _WORKER_MATCHER
+    _WORKER_MATCHER = StockMatcher(stocks)
+
+
+def _scan_task(path, start, end):
+    return scan_range(_WORKER_MATCHER, path, start, end)
+
+
+def extract_parallel(paths, workers=None, shards_per_worker=4, stocks=None):
+    """Mention stats across chat files, sharded by byte range over a process pool."""
+    if isinstance(paths, str):
+        paths = [paths]
+    if stocks is None:
+        stocks = stock_enrichment.ENRICHED_STOCKS
+    workers = workers or os.cpu_count() or 1
+    stocks = {name: set(tags) for name, tags in stocks.items()}
+    tasks = [(path, start, end)
+             for path in paths
+             for start, end in split_ranges(path, workers * shards_per_worker)]
+    total = {}
+    if workers == 1:
+        _init_worker(stocks)
+        for task in tasks:
+            merge_stats(total, _scan_task(*task))
+        return total
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(stocks,)) as pool:
+        for stats in pool.map(_scan_task, *zip(*tasks)):
+            merge_stats(total, stats)
+    return total
+
+
+def write_mention_stats(stats, path=MENTION_STATS_FILE):
+    """Persist stats to processed/chat_mentions.json, busiest companies first."""
+    rows = [{"company_name": company, "mentions": count, "first_seen": first, "last_seen": last}
+            for company, (count, first, last) in stats.items()]
+    rows.sort(key=lambda row: (-row["mentions"], row["company_name"]))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rows, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count stock mentions in chat exports.")
+    parser.add_argument("paths", nargs="*", default=["_chat 7.txt"])
+    parser.add_argument("--workers", type=int, default=None,
+                        help="process pool size (default: all cores); writes processed/chat_mentions.json")
+    args = parser.parse_args()
+
+    if args.workers is None and len(args.paths) == 1:
+        for company, count in count_mentions(extract_file(args.paths[0])).most_common(25):
+            print(f"{company}: {count}")
+    else:
+        stats = extract_parallel(args.paths, args.workers)
+        write_mention_stats(stats)
+        print(f"{len(stats)} companies mentioned; written to {MENTION_STATS_FILE}")
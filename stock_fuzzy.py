@@ -0,0 +1,169 @@
+"""
+Fuzzy company-name matching for misspelt chat mentions ("Nvidea", "Rolls Royce").
+Candidates come from a trigram index over company names and aliases, so edit
+distance is only computed for a handful of likely records.
+"""
+
+import json
+import re
+import unicodedata
+from collections import namedtuple
+
+import stock_enrichment
+
+FuzzyMatch = namedtuple("FuzzyMatch", ["company", "alias", "score"])
+
+DEFAULT_THRESHOLD = 0.75
+# Candidates re-scored with edit distance per query
+CANDIDATES = 24
+# Penalty applied when the query only matches the start of a longer alias
+PREFIX_WEIGHT = 0.9
+# Shorter queries ("AI", "EV") are too generic to match as a prefix
+PREFIX_MIN = 4
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def normalise(text):
+    """Lower-case, strip accents and collapse punctuation/whitespace to single spaces."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a, b):
+    """1 - Levenshtein distance / longer length."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        previous = current
+    return 1.0 - previous[-1] / len(a)
+
+
+def _aliases(stocks, symbols_file):
+    """Yield (alias, company) pairs for names and single-company phrases."""
+    with open(symbols_file, encoding="utf-8") as f:
+        symbols = json.load(f)["stocks"]
+    owners = {}
+    for company, tags in stocks.items():
+        yield company, company
+        for tag in tags:
+            owners.setdefault(tag, set()).add(company)
+    # A keyword that is some company's name or title ("Microsoft" on LSEG)
+    # belongs to that company, not to the one tagged with it
+    names = {normalise(company) for company in stocks}
+    names.update(normalise(stock["title"]) for stock in symbols)
+    # Phrases shared by several companies ("Cloud", "Mining") are themes, not names
+    for tag, companies in owners.items():
+        if len(companies) == 1 and len(tag) >= 4 and not tag.isupper() and normalise(tag) not in names:
+            yield tag, next(iter(companies))
+    # Curated titles ("Oklo Inc") resolve to the enriched company via their symbol
+    for stock in symbols:
+        companies = owners.get(stock["symbol"], ())
+        yield stock["title"], next(iter(companies)) if len(companies) == 1 else stock["title"]
+
+
+class FuzzyIndex:
+    """Trigram index over normalised aliases."""
+
+    def __init__(self, stocks=None, symbols_file=stock_enrichment.SYMBOLS_FILE):
+        if stocks is None:
+            stocks = stock_enrichment.ENRICHED_STOCKS
+        self._entries = []   # id -> (normalised alias, alias, company)
+        self._postings = {}  # trigram -> list of entry ids
+        seen = set()
+        for alias, company in _aliases(stocks, symbols_file):
+            key = normalise(alias)
+            if not key or (key, company) in seen:
+                continue
+            seen.add((key, company))
+            eid = len(self._entries)
+            self._entries.append((key, alias, company))
+            for gram in trigrams(key):
+                self._postings.setdefault(gram, []).append(eid)
+
+    def _score(self, query, key, threshold):
+        score = 0.0
+        # Length difference alone bounds the similarity; skip hopeless pairs
+        if min(len(query), len(key)) / max(len(query), len(key)) >= threshold:
+            score = similarity(query, key)
+        if len(query) >= PREFIX_MIN and len(key) > len(query) and key[len(query)] == " ":
+            score = max(score, similarity(query, key[:len(query)]) * PREFIX_WEIGHT)
+        return score
+
+    def search(self, text, threshold=DEFAULT_THRESHOLD, limit=5):
+        """Ranked FuzzyMatches (best alias per company) scoring >= threshold."""
+        query = normalise(text)
+        if not query:
+            return []
+        grams = trigrams(query)
+        shared = {}
+        for gram in grams:
+            for eid in self._postings.get(gram, ()):
+                shared[eid] = shared.get(eid, 0) + 1
+        candidates = sorted(shared, key=shared.get, reverse=True)[:CANDIDATES]
+
+        best = {}
+        for eid in candidates:
+            key, alias, company = self._entries[eid]
+            score = self._score(query, key, threshold)
+            if score >= threshold and score > best.get(company, (0.0, None))[0]:
+                best[company] = (score, alias)
+        matches = [FuzzyMatch(company, alias, round(score, 4))
+                   for company, (score, alias) in best.items()]
+        # On equal scores a company's own name beats a keyword that mentions it
+        matches.sort(key=lambda m: (-m.score, m.alias != m.company, m.company))
+        return matches[:limit]
+
+
+_INDEX = None
+_LISTENING = False
+
+
+def _reset():
+    global _INDEX
+    _INDEX = None
+
+
+def _on_change(name, old_tags, new_tags):
+    # Alias ownership depends on every company's tags, so rebuild on next use
+    _reset()
+
+
+def get_index():
+    """Shared FuzzyIndex over ENRICHED_STOCKS and stock_symbols.json, rebuilt
+    on first use after stock_enrichment.set_stock/remove_stock/touch."""
+    global _INDEX, _LISTENING
+    if _INDEX is None:
+        _INDEX = FuzzyIndex()
+        if not _LISTENING:
+            stock_enrichment.add_listener(_on_change)
+            stock_enrichment.add_reset_hook(_reset)
+            _LISTENING = True
+    return _INDEX
+
+
+def fuzzy_lookup(text, threshold=DEFAULT_THRESHOLD, limit=5):
+    """Resolve a possibly misspelt name; an exact name, ticker or tag that
+    belongs to a single company scores 1.0.
+
+    Shared tags ("Cloud", "AI") are themes, not names, so they go through
+    the index like any other text rather than matching every company.
+    """
+    exact = stock_enrichment.lookup(text.strip())
+    if len(exact) == 1:
+        return [FuzzyMatch(exact[0], text.strip(), 1.0)]
+    return get_index().search(text, threshold, limit)
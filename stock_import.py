@@ -0,0 +1,396 @@
+"""
+Async importer for stock_database/raw/ sources.
+Streams raw JSON/JSONL exports with incremental parsing, normalises records
+to metadata/schema.json and merges them into ENRICHED_STOCKS, with bounded
+concurrency and a bounded queue for backpressure.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import namedtuple
+
+import stock_enrichment
+import stock_metrics
+import stock_records
+import stock_validate
+
+RAW_DIR = os.path.join(stock_records.BASE_DIR, "stock_database", "raw")
+
+CHUNK_SIZE = 1 << 16
+MAX_CONCURRENT_SOURCES = 4
+QUEUE_SIZE = 1000
+
+ImportStats = namedtuple("ImportStats", ["sources", "records", "merged", "rejected", "seconds"])
+
+# Field spellings seen in platform and chat exports -> schema field
+FIELD_ALIASES = {
+    "company_name": ("company_name", "company", "title", "name"),
+    "ticker": ("ticker", "symbol"),
+    "exchange": ("exchange",),
+    "tags": ("tags",),
+    "keywords": ("keywords",),
+    "description": ("description",),
+    "last_updated": ("last_updated", "updated_at"),
+}
+
+
+def _read_chunk(f):
+    return f.read(CHUNK_SIZE)
+
+
+class Malformed(namedtuple("Malformed", ["path", "error"])):
+    """Yielded in place of a record that could not be decoded.
+
+    normalise() turns it into an empty record, so it is counted as rejected.
+    """
+
+
+def _value_end(text, pos):
+    """Index of the "," or closing bracket ending the JSON value at pos, or
+    None if the value runs past the end of text. Only used to step over a
+    value raw_decode rejected."""
+    depth, in_string, escaped = 0, False, False
+    for i in range(pos, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "[{":
+            depth += 1
+        elif ch in "]}":
+            if depth == 0:
+                return i
+            depth -= 1
+        elif ch == "," and depth == 0:
+            return i
+    return None
+
+
+class _Reader:
+    """Chunked text buffer for decoding one JSON value at a time."""
+
+    def __init__(self, f, path):
+        self.f = f
+        self.path = path
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    async def fill(self):
+        """Append the next chunk, dropping text already consumed."""
+        if self.eof:
+            return False
+        chunk = await asyncio.to_thread(_read_chunk, self.f)
+        self.text, self.pos = self.text[self.pos:] + chunk, 0
+        self.eof = not chunk
+        return not self.eof
+
+    async def peek(self, skip=" \t\r\n"):
+        """Next character after any in `skip`, or "" at end of file."""
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in skip:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not await self.fill():
+                return ""
+
+    async def value(self):
+        """Decode the next value; a Malformed marker if it is not valid JSON."""
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as e:
+                end = _value_end(self.text, self.pos)
+                if end is None and await self.fill():
+                    continue
+                self.pos = len(self.text) if end is None else end
+                return Malformed(self.path, str(e))
+            # a number cut by the chunk boundary decodes as a shorter number
+            if end == len(self.text) and await self.fill():
+                continue
+            self.pos = end
+            return value
+
+    async def array(self):
+        """Yield the elements of the array whose "[" is at the cursor."""
+        self.pos += 1
+        decode = self.decoder.raw_decode
+        while True:
+            # fast path: the next element is already complete in the buffer
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in " \t\r\n,":
+                pos += 1
+            self.pos = pos
+            if pos < len(text) and text[pos] != "]":
+                try:
+                    value, end = decode(text, pos)
+                except json.JSONDecodeError:
+                    end = len(text)
+                if end < len(text):
+                    self.pos = end
+                    yield value
+                    continue
+            ch = await self.peek(" \t\r\n,")
+            if ch == "]":
+                self.pos += 1
+                return
+            if not ch:
+                yield Malformed(self.path, "unterminated array")
+                return
+            value = await self.value()
+            yield value
+            if isinstance(value, Malformed) and self.eof and self.pos == len(self.text):
+                return  # truncated: the bad element ran to the end of the file
+
+
+async def iter_json_records(path):
+    """Yield records from a .jsonl file, a JSON array, or {"stocks"/"records": [...]}.
+
+    Everything is decoded incrementally chunk by chunk, so a multi-GB export
+    never has to fit in memory. A line or element that is not valid JSON is
+    yielded as a Malformed marker and reading carries on with the next one
+    (an array element with unbalanced brackets swallows the rest of the
+    file); a top level that is neither an array nor an object is one
+    Malformed.
+    """
+    f = await asyncio.to_thread(open, path, encoding="utf-8")
+    try:
+        if path.endswith(".jsonl"):
+            buf = ""
+            while True:
+                chunk = await asyncio.to_thread(_read_chunk, f)
+                buf += chunk
+                lines = buf.split("\n")
+                buf = lines.pop() if chunk else ""
+                for line in lines:
+                    if line.strip():
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError as e:
+                            yield Malformed(path, str(e))
+                if not chunk:
+                    return
+
+        reader = _Reader(f, path)
+        ch = await reader.peek()
+        if ch == "[":
+            async for record in reader.array():
+                yield record
+            return
+        if ch != "{":
+            yield Malformed(path, "top level is not an array or object")
+            return
+        # stream the first "stocks"/"records" array; other members are small
+        # metadata and are decoded whole, then dropped
+        reader.pos += 1
+        while await reader.peek(" \t\r\n,") not in ("}", ""):
+            key = await reader.value()
+            if await reader.peek() != ":" or not isinstance(key, str):
+                yield Malformed(path, "expected an object key")
+                return
+            reader.pos += 1
+            if await reader.peek() == "[" and key in ("stocks", "records"):
+                async for record in reader.array():
+                    yield record
+                return
+            if isinstance(await reader.value(), Malformed):
+                yield Malformed(path, f"invalid value for {key!r}")
+                return
+    finally:
+        f.close()
+
+
+class FileSource:
+    """A raw export on disk."""
+
+    def __init__(self, path, source=None):
+        self.path = path
+        self.source = source or os.path.splitext(os.path.basename(path))[0]
+
+    def __repr__(self):
+        return f"FileSource({self.path!r})"
+
+    def records(self):
+        return iter_json_records(self.path)
+
+
+class LocalPlatformFetcher:
+    """Offline stand-in for the external platform API.
+
+    Serves a local export page by page, optionally sleeping between pages to
+    mimic network latency.
+    """
+
+    source = "platform"
+
+    def __init__(self, path=os.path.join(RAW_DIR, "platform_symbols.json"), page_size=500, latency=0.0):
+        self.path = path
+        self.page_size = page_size
+        self.latency = latency
+
+    def __repr__(self):
+        return f"LocalPlatformFetcher({self.path!r})"
+
+    async def records(self):
+        page = []
+        async for record in iter_json_records(self.path):
+            page.append(record)
+            if len(page) >= self.page_size:
+                await asyncio.sleep(self.latency)
+                for item in page:
+                    yield item
+                page = []
+        await asyncio.sleep(self.latency)
+        for item in page:
+            yield item
+
+
+def normalise(raw, source):
+    """Map a raw record onto schema.json field names."""
+    record = {}
+    if not isinstance(raw, dict):
+        return record
+    for field, names in FIELD_ALIASES.items():
+        for name in names:
+            value = raw.get(name)
+            if value not in (None, ""):
+                record[field] = value
+                break
+    for field in ("tags", "keywords"):
+        value = record.get(field, [])
+        if isinstance(value, str):
+            value = [item.strip() for item in value.split(",") if item.strip()]
+        elif isinstance(value, tuple):
+            value = list(value)
+        record[field] = value  # anything else is left for the schema check to reject
+    for field in ("company_name", "ticker", "exchange"):
+        if isinstance(record.get(field), str):
+            record[field] = record[field].strip()
+    record["source"] = raw.get("source", source)
+    return record
+
+
+def merge(record, stocks=None):
+    """Fold a normalised record into ENRICHED_STOCKS; return the company name.
+
+    An existing company is matched by name first, then by ticker.
+    """
+    if stocks is None:
+        stocks = stock_enrichment.ENRICHED_STOCKS
+    name, ticker = record["company_name"], record.get("ticker", "")
+    company = name if name in stocks else None
+    if company is None:
+        matches = stock_enrichment.lookup(name) or (stock_enrichment.lookup(ticker) if ticker else ())
+        company = matches[0] if len(matches) == 1 else name
+    tags = set(stocks.get(company, ()))
+    new_tags = tags | set(record["tags"]) | set(record["keywords"])
+    if ticker:
+        new_tags.add(ticker)
+    if new_tags != tags or company not in stocks:
+        stock_enrichment.set_stock(company, new_tags)
+    return company
+
+
+async def run_import(sources, concurrency=MAX_CONCURRENT_SOURCES, queue_size=QUEUE_SIZE, schema=None):
+    """Stream every source concurrently and merge records; return ImportStats.
+
+    At most `concurrency` sources are read at once, and readers block once
+    `queue_size` records are waiting to be merged. Records that fail
+    normalisation or the schema are counted as rejected; an error raised
+    while merging (e.g. by a stock_enrichment listener) stops the import and
+    is re-raised, since the record is already in ENRICHED_STOCKS.
+    """
+    if schema is None:
+        schema = stock_validate.load_schema()
+    queue = asyncio.Queue(maxsize=queue_size)
+    limit = asyncio.Semaphore(concurrency)
+    counts = {"records": 0, "merged": 0, "rejected": 0}
+    start = time.perf_counter()
+
+    async def produce(source):
+        async with limit:
+            async for raw in source.records():
+                await queue.put(normalise(raw, source.source))
+
+    async def consume():
+        while True:
+            record = await queue.get()
+            counts["records"] += 1
+            try:
+                if any(stock_validate.check_schema(record, schema)):
+                    counts["rejected"] += 1
+                    continue
+                merge(record)  # a failing listener propagates and ends the import
+                counts["merged"] += 1
+            finally:
+                queue.task_done()
+
+    async def feed():
+        await asyncio.gather(*(produce(source) for source in sources))
+        await queue.join()
+
+    # wait on the consumer too: if it dies, readers blocked on a full queue
+    # (and queue.join()) would otherwise wait forever
+    feeder = asyncio.ensure_future(feed())
+    consumer = asyncio.create_task(consume())
+    try:
+        await asyncio.wait((feeder, consumer), return_when=asyncio.FIRST_COMPLETED)
+        if consumer.done():
+            consumer.result()
+        feeder.result()
+    finally:
+        feeder.cancel()
+        consumer.cancel()
+    return ImportStats(len(sources), counts["records"], counts["merged"],
+                       counts["rejected"], time.perf_counter() - start)
+
+
+def discover_sources(raw_dir=RAW_DIR):
+    """Every .json/.jsonl export in raw/, with platform_symbols.json served
+    through LocalPlatformFetcher."""
+    sources = []
+    if not os.path.isdir(raw_dir):
+        return sources
+    for name in sorted(os.listdir(raw_dir)):
+        path = os.path.join(raw_dir, name)
+        if name == "platform_symbols.json":
+            sources.append(LocalPlatformFetcher(path))
+        elif name == "chat_extracted.json":
+            sources.append(FileSource(path, "chat_analysis"))
+        elif name.endswith((".json", ".jsonl")):
+            sources.append(FileSource(path))
+    return sources
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import raw stock sources into the enriched store.")
+    parser.add_argument("paths", nargs="*", help="files to import (default: everything in raw/)")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENT_SOURCES)
+    parser.add_argument("--build", action="store_true", help="rebuild processed/ and exports/ afterwards")
+    args = parser.parse_args()
+
+    stock_metrics.init()
+    sources = [FileSource(path) for path in args.paths] or discover_sources()
+    stats = asyncio.run(run_import(sources, args.concurrency))
+    rate = stats.records / stats.seconds if stats.seconds else 0.0
+    print(f"{stats.sources} source(s), {stats.records} record(s): {stats.merged} merged, "
+          f"{stats.rejected} rejected in {stats.seconds:.2f}s ({rate:,.0f} records/sec)")
+    if stock_metrics.enabled():
+        print(json.dumps(stock_metrics.snapshot(), indent=2))
+    if args.build:
+        import build_database
+
+        build_database.build()
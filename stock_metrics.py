@@ -0,0 +1,133 @@
+"""
+Optional timing and counter hooks for the stock hot paths.
+Off by default and free when off: enable() swaps timing wrappers onto the
+registered functions and disable() puts the originals back. Nothing is
+wrapped on import, since enable() imports the instrumented modules. Entry
+points (benchmarks.py, stock_import.py, the stock_rollups server) call
+init() once everything is imported, which enables the hooks when
+STOCK_METRICS=1 is set.
+"""
+
+import functools
+import importlib
+import inspect
+import os
+import threading
+import time
+
+# (module, attribute path) of every instrumented hot path
+HOT_PATHS = [
+    ("stock_enrichment", "get_stock"),
+    ("stock_enrichment", "lookup"),
+    ("stock_enrichment", "resolve_many"),
+    ("stock_enrichment", "to_json"),
+    ("stock_enrichment", "format_stocks"),
+    ("stock_cache", "get_payload"),
+    ("stock_fuzzy", "fuzzy_lookup"),
+    ("stock_tags", "query"),
+    ("stock_extractor", "StockMatcher.scan"),
+]
+
+ENV_VAR = "STOCK_METRICS"
+
+_LOCK = threading.Lock()
+_TIMINGS = {}    # name -> [calls, total seconds, max seconds]
+_COUNTERS = {}   # name -> int
+_ORIGINALS = {}  # (owner, attribute) -> original function
+
+
+def enabled():
+    return bool(_ORIGINALS)
+
+
+def incr(name, amount=1):
+    """Bump a named counter (cheap enough to leave in place when disabled)."""
+    with _LOCK:
+        _COUNTERS[name] = _COUNTERS.get(name, 0) + amount
+
+
+def record(name, seconds):
+    """Add one timed call to a named timing."""
+    with _LOCK:
+        entry = _TIMINGS.get(name)
+        if entry is None:
+            _TIMINGS[name] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+
+
+def _timed(name, func):
+    perf_counter = time.perf_counter
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def gen_wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                yield from func(*args, **kwargs)
+            finally:
+                record(name, perf_counter() - start)
+        return gen_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(name, perf_counter() - start)
+    return wrapper
+
+
+def _resolve(module_name, path):
+    owner = importlib.import_module(module_name)
+    *parents, attribute = path.split(".")
+    for parent in parents:
+        owner = getattr(owner, parent)
+    return owner, attribute
+
+
+def enable(hot_paths=None):
+    """Wrap every hot path with a timer."""
+    for module_name, path in hot_paths or HOT_PATHS:
+        owner, attribute = _resolve(module_name, path)
+        key = (owner, attribute)
+        if key in _ORIGINALS:
+            continue
+        original = getattr(owner, attribute)
+        _ORIGINALS[key] = original
+        setattr(owner, attribute, _timed(f"{module_name}.{path}", original))
+
+
+def init():
+    """Enable the hooks if STOCK_METRICS=1; return whether they are on."""
+    if os.environ.get(ENV_VAR) == "1":
+        enable()
+    return enabled()
+
+
+def disable():
+    """Restore the unwrapped functions."""
+    for (owner, attribute), original in _ORIGINALS.items():
+        setattr(owner, attribute, original)
+    _ORIGINALS.clear()
+
+
+def snapshot():
+    """Machine-readable view of every timing and counter."""
+    with _LOCK:
+        timings = {
+            name: {"calls": calls, "total_ms": total * 1e3,
+                   "mean_us": total / calls * 1e6, "max_us": worst * 1e6}
+            for name, (calls, total, worst) in _TIMINGS.items()
+        }
+        return {"timings": timings, "counters": dict(_COUNTERS)}
+
+
+def reset():
+    with _LOCK:
+        _TIMINGS.clear()
+        _COUNTERS.clear()
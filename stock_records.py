@@ -0,0 +1,318 @@
+"""
+Compact structured records for the enriched stock universe.
+Splits each ENRICHED_STOCKS tag set into ticker, alternate listings, exchange,
+taxonomy tags and free-form keywords (see stock_database/metadata/schema.json),
+joined against the exchange data in stock_symbols.json.
+"""
+
+import csv
+import io
+import json
+import os
+import re
+
+import stock_enrichment
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CATEGORIES_FILE = os.path.join(BASE_DIR, "stock_database", "metadata", "categories.json")
+
+_CODE = re.compile(r"^[A-Z0-9][A-Z0-9.\-]*$")
+
+# Upper-case acronyms in the tag sets that are themes or products, not listings
+NON_TICKER_CODES = {
+    "3D", "5G", "AAV-GAD", "API", "AWS", "BTC", "CNC", "CPG", "CPU", "CRISPR",
+    "DRAM", "DRC", "ETF", "EUV", "F80", "GI", "GLP-1", "HALEU", "HBM", "HBM4",
+    "ISR", "LAG-3", "LNG", "MLM", "MSG", "NAND", "NATO", "NGS", "NHS", "PGM",
+    "QLE", "RFK", "UGC", "YNAP",
+}
+
+# Primary listing for companies that carry several genuine ticker codes
+PRIMARY_TICKERS = {
+    "Alphabet": "GOOGL",
+    "Amazon": "AMZN",
+    "BAE Systems": "BA.",
+    "Berkshire Hathaway": "BRK.B",
+    "British American Tobacco": "BATS",
+    "BYD": "1211",
+    "LVMH": "MC",
+    "Novo Nordisk": "NVO",
+    "Roche": "ROG",
+    "Samsung": "005930",
+    "Tencent": "0700",
+    "Volkswagen": "VOW3",
+}
+
+
+class _Interner:
+    """Shared string table so every record stores small int ids."""
+
+    def __init__(self):
+        self.terms = []
+        self.ids = {}
+
+    def intern(self, term):
+        tid = self.ids.get(term)
+        if tid is None:
+            tid = self.ids[term] = len(self.terms)
+            self.terms.append(term)
+        return tid
+
+    def ids_for(self, terms):
+        """Interned ids for terms, ordered by the terms themselves."""
+        return tuple(self.intern(term) for term in sorted(terms))
+
+
+TERMS = _Interner()
+
+
+class StockRecord:
+    """One company with structured fields; tags/keywords are interned ids."""
+
+    __slots__ = ("company_name", "ticker", "listings", "exchange",
+                 "tag_ids", "keyword_ids", "categories")
+
+    def __init__(self, company_name, ticker, listings, exchange,
+                 tag_ids, keyword_ids, categories):
+        self.company_name = company_name
+        self.ticker = ticker
+        self.listings = listings
+        self.exchange = exchange
+        self.tag_ids = tag_ids
+        self.keyword_ids = keyword_ids
+        self.categories = categories
+
+    @property
+    def tags(self):
+        return tuple(TERMS.terms[i] for i in self.tag_ids)
+
+    @property
+    def keywords(self):
+        return tuple(TERMS.terms[i] for i in self.keyword_ids)
+
+    def to_dict(self):
+        """Schema-shaped dict with deterministic ordering."""
+        record = {"company_name": self.company_name, "ticker": self.ticker}
+        if self.exchange:
+            record["exchange"] = self.exchange
+        if self.listings:
+            record["listings"] = list(self.listings)
+        record["tags"] = list(self.tags)
+        record["keywords"] = list(self.keywords)
+        record["categories"] = list(self.categories)
+        record["source"] = "stock_enrichment.py"
+        return record
+
+    def __repr__(self):
+        return f"StockRecord({self.company_name!r}, ticker={self.ticker!r}, exchange={self.exchange!r})"
+
+
+def load_taxonomy(path=CATEGORIES_FILE):
+    """Return (upper-cased tag -> category keys, upper-cased geographic tags,
+    taxonomy tags as spelled in categories.json)."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    tag_categories, spellings = {}, set(data["geographic"]["tags"])
+    for key, category in data["categories"].items():
+        for tag in category["tags"]:
+            tag_categories.setdefault(tag.upper(), []).append(key)
+            spellings.add(tag)
+    return tag_categories, {tag.upper() for tag in data["geographic"]["tags"]}, spellings
+
+
+def load_exchanges(path=stock_enrichment.SYMBOLS_FILE):
+    """Return (symbol -> exchange, title -> (symbol, exchange)) from stock_symbols.json."""
+    with open(path, encoding="utf-8") as f:
+        stocks = json.load(f)["stocks"]
+    by_symbol, by_title = {}, {}
+    for stock in stocks:
+        by_symbol.setdefault(stock["symbol"], stock["exchange"])
+        by_title.setdefault(stock["title"], (stock["symbol"], stock["exchange"]))
+    return by_symbol, by_title
+
+
+def split_tags(company, tags, tag_categories, geographic, spellings, by_symbol, by_title):
+    """Build a StockRecord from a raw ENRICHED_STOCKS tag set."""
+    codes, taxonomy, keywords = [], [], []
+    for tag in tags:
+        key = tag.upper()
+        is_code = _CODE.match(tag) and tag not in NON_TICKER_CODES
+        # "SPACE" is SpaceX's ticker, not the "Space" category; "AI" and "UK"
+        # are spelled that way in the taxonomy itself
+        if (key in tag_categories or key in geographic) and not (is_code and tag not in spellings):
+            taxonomy.append(tag)
+        elif is_code:
+            codes.append(tag)
+        else:
+            keywords.append(tag)
+    codes.sort()
+
+    ticker = PRIMARY_TICKERS.get(company)
+    if ticker is None and company in by_title and by_title[company][0] in codes:
+        ticker = by_title[company][0]
+    if ticker is None:
+        listed = [code for code in codes if code in by_symbol]
+        ticker = listed[0] if listed else (codes[0] if codes else "")
+    listings = tuple(code for code in codes if code != ticker)
+
+    exchange = by_symbol.get(ticker) if ticker else None
+    if exchange is None and company in by_title:
+        exchange = by_title[company][1]
+
+    categories = sorted({c for tag in taxonomy for c in tag_categories.get(tag.upper(), ())})
+    return StockRecord(company, ticker, listings, exchange,
+                       TERMS.ids_for(taxonomy), TERMS.ids_for(keywords), tuple(categories))
+
+
+class RecordStore:
+    """All companies as StockRecords, addressable by name or ticker.
+
+    A ticker shared by several companies belongs to the first of them in
+    ENRICHED_STOCKS order, and other companies' listings never include it.
+    Edits keep both rules, so the store always matches a fresh build.
+    """
+
+    def __init__(self, stocks=None):
+        if stocks is None:
+            stocks = stock_enrichment.ENRICHED_STOCKS
+        self._taxonomy = load_taxonomy()
+        self._exchanges = load_exchanges()
+        self._records = {}     # company -> StockRecord, in ENRICHED_STOCKS order
+        self._order = {}       # company -> insertion sequence number
+        self._owners = {}      # upper-cased ticker -> records using it, in order
+        self._listings = {}    # company -> listings before foreign tickers are dropped
+        self._listed_by = {}   # upper-cased code -> companies listing it
+        self._next = 0
+        for company, tags in stocks.items():
+            self._insert(company, tags)
+        for record in self._records.values():
+            self._drop_foreign_listings(record)
+
+    def _owner(self, code):
+        owners = self._owners.get(code.upper())
+        return owners[0] if owners else None
+
+    def _drop_foreign_listings(self, record):
+        # Oklo and Lightbridge carry "SMR" as a theme; it is NuScale's ticker
+        record.listings = tuple(code for code in self._listings[record.company_name]
+                                if self._owner(code) in (None, record))
+
+    def _insert(self, company, tags):
+        record = split_tags(company, tags, *self._taxonomy, *self._exchanges)
+        if company not in self._order:
+            self._order[company] = self._next
+            self._next += 1
+        self._records[company] = record
+        self._listings[company] = record.listings
+        for code in record.listings:
+            self._listed_by.setdefault(code.upper(), set()).add(company)
+        if record.ticker:
+            owners = self._owners.setdefault(record.ticker.upper(), [])
+            order = self._order
+            i = 0
+            while i < len(owners) and order[owners[i].company_name] < order[company]:
+                i += 1
+            owners.insert(i, record)
+        return record
+
+    def _detach(self, company):
+        """Drop a company from the ticker/listing maps; return its old record."""
+        record = self._records.get(company)
+        if record is None:
+            return None
+        for code in self._listings.pop(company):
+            listed = self._listed_by[code.upper()]
+            listed.discard(company)
+            if not listed:
+                del self._listed_by[code.upper()]
+        if record.ticker:
+            owners = self._owners[record.ticker.upper()]
+            owners.remove(record)
+            if not owners:
+                del self._owners[record.ticker.upper()]
+        return record
+
+    def _refresh_listings(self, *tickers):
+        # A change of ticker owner can add or drop that code from other listings
+        for ticker in tickers:
+            if ticker:
+                for company in self._listed_by.get(ticker.upper(), ()):
+                    self._drop_foreign_listings(self._records[company])
+
+    def add(self, company, tags):
+        """Insert or replace a company's record (keeping its position on replace)."""
+        old = self._detach(company)
+        record = self._insert(company, tags)
+        self._drop_foreign_listings(record)
+        self._refresh_listings(old.ticker if old else "", record.ticker)
+
+    def remove(self, company):
+        record = self._detach(company)
+        if record is None:
+            return
+        del self._records[company]
+        del self._order[company]
+        self._refresh_listings(record.ticker)
+
+    def on_change(self, name, old_tags, new_tags):
+        """stock_enrichment listener: apply a single edit incrementally."""
+        if new_tags is None:
+            self.remove(name)
+        else:
+            self.add(name, new_tags)
+
+    def get(self, company):
+        return self._records.get(company)
+
+    def by_ticker(self, ticker):
+        return self._owner(ticker)
+
+    def by_exchange(self):
+        """Exchange -> company names; companies without an exchange go under None."""
+        grouped = {}
+        for record in self._records.values():
+            grouped.setdefault(record.exchange, []).append(record.company_name)
+        return grouped
+
+    def to_list(self):
+        """Schema-shaped dicts for the whole universe, sorted by company name."""
+        return [self._records[name].to_dict() for name in sorted(self._records)]
+
+    def __iter__(self):
+        return iter(self._records.values())
+
+    def __len__(self):
+        return len(self._records)
+
+    def reload(self, stocks=None):
+        """Rebuild every record from scratch (after direct edits to ENRICHED_STOCKS)."""
+        self.__init__(stocks)
+
+
+CSV_FIELDS = ["company_name", "ticker", "exchange", "listings", "tags", "keywords", "categories"]
+
+
+def render_csv(records):
+    """Schema-shaped records as CSV text, list fields joined with "; "."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=CSV_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    for record in records:
+        row = {field: record.get(field, "") for field in CSV_FIELDS}
+        for field in ("listings", "tags", "keywords", "categories"):
+            row[field] = "; ".join(row[field])
+        writer.writerow(row)
+    return buf.getvalue()
+
+
+_STORE = None
+
+
+def get_store():
+    """Shared RecordStore over ENRICHED_STOCKS, built on first use and kept
+    current through stock_enrichment.set_stock/remove_stock."""
+    global _STORE
+    if _STORE is None:
+        _STORE = RecordStore()
+        stock_enrichment.add_listener(_STORE.on_change)
+        stock_enrichment.add_reset_hook(_STORE.reload)
+    return _STORE
@@ -0,0 +1,258 @@
+"""
+Precomputed category and exchange rollups for dashboards.
+Category -> companies, exchange -> companies and multi-category overlap
+counts are kept in memory, updated per company as ENRICHED_STOCKS changes,
+and served as JSON from a small local HTTP API.
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import combinations
+from urllib.parse import unquote
+
+import stock_enrichment
+import stock_metrics
+import stock_records
+
+OTHER = "other"        # companies with no category tag (as in build_database)
+UNKNOWN = "UNKNOWN"    # companies with no known exchange
+
+
+def _load_category_names(path=stock_records.CATEGORIES_FILE):
+    with open(path, encoding="utf-8") as f:
+        categories = json.load(f)["categories"]
+    return {key: category["name"] for key, category in categories.items()}
+
+
+class Rollups:
+    """Category/exchange membership and overlap counts over a RecordStore.
+
+    Each company contributes once to its categories, its exchange, every
+    pair of its categories and its exact category combination, so an edit
+    only touches that company's entries.
+    """
+
+    def __init__(self, store=None):
+        if store is None:
+            store = stock_records.RecordStore()
+        self.store = store
+        self.names = _load_category_names()
+        self._categories = {key: set() for key in self.names}
+        self._categories[OTHER] = set()
+        self._exchanges = {}
+        self._pairs = Counter()          # (category, category), sorted -> companies in both
+        self._combinations = Counter()   # sorted category tuple -> companies with exactly those
+        self._members = {}               # company -> (categories, exchange)
+        self._sorted = {}                # (kind, key) -> cached sorted members
+        for record in store:
+            self.add(record)
+
+    def reload(self):
+        """Recount everything from the store (after it was rebuilt)."""
+        self.__init__(self.store)
+
+    def add(self, record):
+        """Count a StockRecord, replacing any previous entry for the company."""
+        company = record.company_name
+        self.remove(company)
+        categories = record.categories or (OTHER,)
+        exchange = record.exchange or UNKNOWN
+        for key in categories:
+            self._categories.setdefault(key, set()).add(company)
+            self._sorted.pop(("category", key), None)
+        self._exchanges.setdefault(exchange, set()).add(company)
+        self._sorted.pop(("exchange", exchange), None)
+        self._pairs.update(combinations(categories, 2))
+        self._combinations[categories] += 1
+        self._members[company] = (categories, exchange)
+
+    def remove(self, company):
+        entry = self._members.pop(company, None)
+        if entry is None:
+            return
+        categories, exchange = entry
+        for key in categories:
+            self._categories[key].discard(company)
+            self._sorted.pop(("category", key), None)
+        members = self._exchanges[exchange]
+        members.discard(company)
+        if not members:
+            del self._exchanges[exchange]
+        self._sorted.pop(("exchange", exchange), None)
+        for pair in combinations(categories, 2):
+            self._decrement(self._pairs, pair)
+        self._decrement(self._combinations, categories)
+
+    @staticmethod
+    def _decrement(counter, key):
+        if counter[key] <= 1:
+            del counter[key]
+        else:
+            counter[key] -= 1
+
+    def on_change(self, name, old_tags, new_tags):
+        """stock_enrichment listener; runs after the RecordStore has applied the edit."""
+        if new_tags is None:
+            self.remove(name)
+        else:
+            self.add(self.store.get(name))
+
+    def _members_sorted(self, kind, key, groups):
+        # only known keys are cached, so arbitrary API paths can't grow _sorted
+        members = groups.get(key)
+        if members is None:
+            return ()
+        cached = self._sorted.get((kind, key))
+        if cached is None:
+            cached = self._sorted[(kind, key)] = tuple(sorted(members))
+        return cached
+
+    def category_counts(self):
+        """Category key -> number of companies, including "other"."""
+        return {key: len(members) for key, members in self._categories.items()}
+
+    def companies_in(self, category):
+        """Sorted companies in a category, as a tuple."""
+        return self._members_sorted("category", category, self._categories)
+
+    def exchange_counts(self):
+        """Exchange -> number of companies, "UNKNOWN" for unlisted."""
+        return {exchange: len(members) for exchange, members in sorted(self._exchanges.items())}
+
+    def companies_on(self, exchange):
+        """Sorted companies listed on an exchange, as a tuple."""
+        return self._members_sorted("exchange", exchange, self._exchanges)
+
+    def overlap(self, first, second):
+        """Number of companies in both categories."""
+        if first == second:
+            return len(self._categories.get(first, ()))
+        return self._pairs.get(tuple(sorted((first, second))), 0)
+
+    def overlaps(self):
+        """Every category pair sharing companies, as [(a, b, count)] busiest first."""
+        return sorted(((a, b, n) for (a, b), n in self._pairs.items()), key=lambda item: (-item[2], item[:2]))
+
+    def multi_category(self, min_categories=2):
+        """Exact category combinations held by companies, as [(categories, count)]."""
+        rows = [(combo, n) for combo, n in self._combinations.items() if len(combo) >= min_categories]
+        return sorted(rows, key=lambda item: (-item[1], item[0]))
+
+    def summary(self):
+        """Dashboard view: counts per category and exchange plus overlaps."""
+        return {
+            "companies": len(self._members),
+            "categories": {key: {"name": self.names.get(key, "Other"), "count": count}
+                           for key, count in self.category_counts().items()},
+            "exchanges": self.exchange_counts(),
+            "overlaps": [{"categories": [a, b], "count": n} for a, b, n in self.overlaps()],
+            "multi_category": [{"categories": list(combo), "count": n}
+                               for combo, n in self.multi_category()],
+        }
+
+
+def full_scan(stocks=None):
+    """Category and exchange membership rebuilt from scratch (the dashboard
+    baseline the rollups replace)."""
+    store = stock_records.RecordStore(stocks)
+    categories, exchanges, pairs = {}, {}, Counter()
+    for record in store:
+        keys = record.categories or (OTHER,)
+        for key in keys:
+            categories.setdefault(key, []).append(record.company_name)
+        exchanges.setdefault(record.exchange or UNKNOWN, []).append(record.company_name)
+        pairs.update(combinations(keys, 2))
+    return categories, exchanges, pairs
+
+
+_ROLLUPS = None
+
+
+def get_rollups():
+    """Shared Rollups over ENRICHED_STOCKS, built on first use and kept
+    current through stock_enrichment.set_stock/remove_stock and touch()."""
+    global _ROLLUPS
+    if _ROLLUPS is None:
+        # get_store() registers its listener and reset hook first, so records
+        # are fresh in on_change and reload
+        _ROLLUPS = Rollups(stock_records.get_store())
+        stock_enrichment.add_listener(_ROLLUPS.on_change)
+        stock_enrichment.add_reset_hook(_ROLLUPS.reload)
+    return _ROLLUPS
+
+
+# --- Local query API ----------------------------------------------------------
+
+def route(path):
+    """JSON-ready result for an API path, or None if it is unknown.
+
+    /summary, /categories, /categories/<key>, /exchanges, /exchanges/<code>,
+    /overlaps, /overlaps/<a>/<b>, and /metrics when stock_metrics is enabled
+    """
+    rollups = get_rollups()
+    parts = [unquote(part) for part in path.split("?", 1)[0].strip("/").split("/") if part]
+    if parts in ([], ["summary"]):
+        return rollups.summary()
+    if parts == ["categories"]:
+        return rollups.category_counts()
+    if parts == ["exchanges"]:
+        return rollups.exchange_counts()
+    if parts == ["metrics"]:
+        return stock_metrics.snapshot() if stock_metrics.enabled() else None
+    if parts == ["overlaps"]:
+        return [{"categories": [a, b], "count": n} for a, b, n in rollups.overlaps()]
+    if len(parts) == 2 and parts[0] == "categories":
+        return {"category": parts[1], "companies": rollups.companies_in(parts[1])}
+    if len(parts) == 2 and parts[0] == "exchanges":
+        return {"exchange": parts[1], "companies": rollups.companies_on(parts[1])}
+    if len(parts) == 3 and parts[0] == "overlaps":
+        return {"categories": parts[1:], "count": rollups.overlap(parts[1], parts[2])}
+    return None
+
+
+class RollupHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        start = time.perf_counter()
+        result = route(self.path)
+        status = 200 if result is not None else 404
+        body = json.dumps(result if result is not None else {"error": "not found"},
+                          ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Dataset-Version", str(stock_enrichment.dataset_version()))
+        self.send_header("Server-Timing", f"rollup;dur={(time.perf_counter() - start) * 1e3:.3f}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host="127.0.0.1", port=8765):
+    get_rollups()
+    stock_metrics.init()
+    server = ThreadingHTTPServer((host, port), RollupHandler)
+    print(f"Serving rollups on http://{host}:{port}/summary")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Category and exchange rollups.")
+    parser.add_argument("--serve", action="store_true", help="start the local JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.host, args.port)
+    else:
+        print(json.dumps(get_rollups().summary(), indent=2, ensure_ascii=False))
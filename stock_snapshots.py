@@ -0,0 +1,243 @@
+"""
+Versioned snapshots of ENRICHED_STOCKS with a change feed.
+Each snapshot writes only its delta against the previous version (added,
+removed and per-company tag changes) to processed/snapshots/, so consumers
+can poll changes_since(N) and patch their copy instead of reloading the
+whole dataset.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import build_database
+import stock_enrichment
+
+SNAPSHOT_DIR = os.path.join(build_database.PROCESSED_DIR, "snapshots")
+DATA_SOURCES_FILE = os.path.join(build_database.DATABASE_DIR, "metadata", "data_sources.json")
+SOURCE_NAME = "stock_enrichment.py"
+
+# Layout of SNAPSHOT_DIR:
+#   manifest.json      one entry per version: created, last_synced, checksum, counts
+#   latest.json        full dataset at the newest version
+#   changes/000002.json  delta from version 1 to version 2, and so on
+# A delta is {"from", "to", "added": {company: tags}, "removed": {company: old tags},
+# "changed": {company: {"added": tags, "removed": tags}}}. Removed companies
+# keep their old tags so deltas compose and can be reversed.
+
+
+def _canonical(stocks):
+    return {name: sorted(tags) for name, tags in sorted(stocks.items())}
+
+
+def _checksum(canonical):
+    text = json.dumps(canonical, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _read_json(path, default=None):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(build_database._dump_json(data))
+    os.replace(tmp, path)
+
+
+def _changes_file(directory, version):
+    return os.path.join(directory, "changes", f"{version:06d}.json")
+
+
+def diff(old, new):
+    """Delta between two {company: tags} mappings (versions left unset)."""
+    added, removed, changed = {}, {}, {}
+    for name, tags in new.items():
+        before = old.get(name)
+        if before is None:
+            added[name] = sorted(tags)
+            continue
+        before, tags = set(before), set(tags)
+        if before != tags:
+            changed[name] = {"added": sorted(tags - before), "removed": sorted(before - tags)}
+    for name, tags in old.items():
+        if name not in new:
+            removed[name] = sorted(tags)
+    return {"from": None, "to": None, "added": added, "removed": removed, "changed": changed}
+
+
+def is_empty(delta):
+    return not (delta["added"] or delta["removed"] or delta["changed"])
+
+
+def compose(deltas):
+    """Fold consecutive deltas into one net delta from the first to the last."""
+    ops = {}  # company -> ("added", tags) | ("removed", base tags) | ("changed", added, removed)
+    for delta in deltas:
+        for name, tags in delta["removed"].items():
+            op = ops.get(name)
+            if op is None:
+                ops[name] = ("removed", set(tags))
+            elif op[0] == "changed":
+                ops[name] = ("removed", (set(tags) - op[1]) | op[2])
+            else:  # added since the base, so it never existed there
+                del ops[name]
+        for name, tags in delta["added"].items():
+            op = ops.get(name)
+            if op is not None and op[0] == "removed":
+                base = op[1]
+                ops[name] = ("changed", set(tags) - base, base - set(tags))
+            else:
+                ops[name] = ("added", set(tags))
+        for name, change in delta["changed"].items():
+            plus, minus = set(change["added"]), set(change["removed"])
+            op = ops.get(name)
+            if op is None:
+                ops[name] = ("changed", plus, minus)
+            elif op[0] == "added":
+                ops[name] = ("added", (op[1] - minus) | plus)
+            else:
+                gained, lost = op[1], op[2]
+                ops[name] = ("changed", (gained - minus) | (plus - lost), (lost - plus) | (minus - gained))
+
+    result = {"from": deltas[0]["from"] if deltas else None,
+              "to": deltas[-1]["to"] if deltas else None,
+              "added": {}, "removed": {}, "changed": {}}
+    for name in sorted(ops):
+        op = ops[name]
+        if op[0] == "added":
+            result["added"][name] = sorted(op[1])
+        elif op[0] == "removed":
+            result["removed"][name] = sorted(op[1])
+        elif op[1] or op[2]:
+            result["changed"][name] = {"added": sorted(op[1]), "removed": sorted(op[2])}
+    return result
+
+
+def apply_changes(stocks, delta):
+    """Patch a {company: set of tags} dict in place with a delta; return it."""
+    for name in delta["removed"]:
+        stocks.pop(name, None)
+    for name, tags in delta["added"].items():
+        stocks[name] = set(tags)
+    for name, change in delta["changed"].items():
+        tags = set(stocks.get(name, ()))
+        tags.difference_update(change["removed"])
+        tags.update(change["added"])
+        stocks[name] = tags
+    return stocks
+
+
+def load_manifest(directory=SNAPSHOT_DIR):
+    return _read_json(os.path.join(directory, "manifest.json"), {"versions": []})
+
+
+def latest_version(directory=SNAPSHOT_DIR):
+    """Newest snapshot version, or 0 before the first snapshot."""
+    versions = load_manifest(directory)["versions"]
+    return versions[-1]["version"] if versions else 0
+
+
+def load_latest(directory=SNAPSHOT_DIR):
+    """(version, {company: sorted tags}) for the newest snapshot."""
+    snapshot = _read_json(os.path.join(directory, "latest.json"), {"version": 0, "stocks": {}})
+    return snapshot["version"], snapshot["stocks"]
+
+
+def _record_sync(version, synced, path):
+    sources = _read_json(path)
+    if sources is None:
+        return
+    entry = sources["sources"].setdefault(SOURCE_NAME, {})
+    entry["last_synced"] = synced
+    entry["snapshot_version"] = version
+    sources.setdefault("metadata", {})["last_updated"] = synced
+    _write_json(path, sources)
+
+
+def take_snapshot(stocks=None, directory=SNAPSHOT_DIR, data_sources=DATA_SOURCES_FILE):
+    """Record a new version if the data changed; return (version, delta).
+
+    The delta is None when nothing changed since the latest snapshot. Every
+    new version also stamps last_synced in data_sources.json.
+    """
+    if stocks is None:
+        stocks = stock_enrichment.ENRICHED_STOCKS
+    current = _canonical(stocks)
+    previous_version, previous = load_latest(directory)
+    delta = diff(previous, current)
+    if previous_version and is_empty(delta):
+        return previous_version, None
+
+    version = previous_version + 1
+    created = time.strftime("%Y-%m-%dT%H:%M:%S")
+    synced = created[:10]
+    checksum = _checksum(current)
+    delta["from"], delta["to"] = previous_version, version
+    _write_json(_changes_file(directory, version), delta)
+    _write_json(os.path.join(directory, "latest.json"),
+                {"version": version, "created": created, "checksum": checksum, "stocks": current})
+
+    manifest = load_manifest(directory)
+    manifest["versions"].append({
+        "version": version,
+        "created": created,
+        "last_synced": synced,
+        "checksum": checksum,
+        "companies": len(current),
+        "added": len(delta["added"]),
+        "removed": len(delta["removed"]),
+        "changed": len(delta["changed"]),
+    })
+    _write_json(os.path.join(directory, "manifest.json"), manifest)
+    _record_sync(version, synced, data_sources)
+    return version, delta
+
+
+def changes_since(version, directory=SNAPSHOT_DIR):
+    """Net delta from `version` to the newest snapshot.
+
+    Version 0 returns the whole dataset as additions; the current version
+    returns an empty delta.
+    """
+    latest = latest_version(directory)
+    if not 0 <= version <= latest:
+        raise ValueError(f"Unknown snapshot version {version} (latest is {latest})")
+    if version == latest:
+        return {"from": version, "to": latest, "added": {}, "removed": {}, "changed": {}}
+    if version == 0:
+        _, stocks = load_latest(directory)
+        return {"from": 0, "to": latest, "added": stocks, "removed": {}, "changed": {}}
+    deltas = [_read_json(_changes_file(directory, v)) for v in range(version + 1, latest + 1)]
+    return compose(deltas)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot ENRICHED_STOCKS and serve its change feed.")
+    parser.add_argument("--since", type=int, help="print the delta since this version as JSON")
+    parser.add_argument("--list", action="store_true", help="list recorded versions")
+    args = parser.parse_args()
+
+    if args.since is not None:
+        json.dump(changes_since(args.since), sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.list:
+        for entry in load_manifest()["versions"]:
+            print(f"v{entry['version']:<5} {entry['created']}  {entry['companies']} companies  "
+                  f"+{entry['added']} -{entry['removed']} ~{entry['changed']}")
+    else:
+        version, delta = take_snapshot()
+        if delta is None:
+            print(f"No changes since v{version}")
+        else:
+            print(f"Snapshot v{version}: +{len(delta['added'])} -{len(delta['removed'])} "
+                  f"~{len(delta['changed'])}")
@@ -0,0 +1,228 @@
+"""
+Tag -> companies inverted index with set-algebra queries.
+Each common tag's posting list is a bitset (a Python int) over integer
+company ids, so AND/OR/NOT queries and counts are a handful of big-int
+operations.
+"""
+
+import stock_enrichment
+
+
+# A bitset costs universe/8 bytes however few companies carry the tag, so
+# tags carried by fewer than 1 in SPARSE_RATIO companies (e.g. tickers in a
+# large universe) keep a set of ids instead; a set costs roughly that many
+# bytes per id.
+SPARSE_RATIO = 256
+
+
+def _bitset(ids, size):
+    """Int with the given bit positions set, built in one pass over a buffer."""
+    buf = bytearray(size)
+    for i in ids:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+class TagIndex:
+    """Bitset posting lists over a company table.
+
+    Tags are matched case-insensitively. Company ids stay stable for the
+    lifetime of the index; a removed company's id is simply left unset.
+    Rare tags keep a set of ids and are turned into a bitset per query.
+    """
+
+    def __init__(self, stocks=None):
+        if stocks is None:
+            stocks = stock_enrichment.ENRICHED_STOCKS
+        self.companies = []   # id -> company name (None once removed)
+        self._ids = {}        # company name -> id
+        self._keys = []       # id -> upper-cased tags the company is indexed under
+        self._bits = {}       # upper-cased tag -> bitset of company ids (common tags)
+        self._sparse = {}     # upper-cased tag -> set of company ids (rare tags)
+        self._labels = {}     # upper-cased tag -> tag as first written
+        # Collect ids first and build each bitset once: OR-ing bits in one at
+        # a time would copy an ever-growing int per company.
+        postings = {}
+        for company, tags in stocks.items():
+            cid = len(self.companies)
+            self.companies.append(company)
+            self._ids[company] = cid
+            keys = self._tag_keys(tags)
+            self._keys.append(keys)
+            for key in keys:
+                postings.setdefault(key, []).append(cid)
+        for key, ids in postings.items():
+            if self._dense(len(ids)):
+                self._bits[key] = _bitset(ids, (ids[-1] >> 3) + 1)
+            else:
+                self._sparse[key] = set(ids)
+        self._live = (1 << len(self.companies)) - 1
+
+    def _dense(self, count):
+        return count * SPARSE_RATIO >= len(self.companies)
+
+    def _tag_keys(self, tags):
+        keys = []
+        for tag in tags:
+            key = tag.upper()
+            if key not in self._labels:
+                self._labels[key] = tag
+            if key not in keys:
+                keys.append(key)
+        return tuple(keys)
+
+    def add(self, company, tags):
+        """Index a company, replacing any tags it already had."""
+        self.remove(company)
+        cid = self._ids.get(company)
+        if cid is None:
+            cid = len(self.companies)
+            self.companies.append(company)
+            self._keys.append(())
+            self._ids[company] = cid
+        else:
+            self.companies[cid] = company
+        bit = 1 << cid
+        self._live |= bit
+        keys = self._keys[cid] = self._tag_keys(tags)
+        for key in keys:
+            if key in self._bits:
+                self._bits[key] |= bit
+                continue
+            ids = self._sparse.setdefault(key, set())
+            ids.add(cid)
+            if self._dense(len(ids)):
+                self._bits[key] = _bitset(ids, (max(ids) >> 3) + 1)
+                del self._sparse[key]
+
+    def remove(self, company):
+        """Drop a company from its own posting lists (its id is kept for reuse)."""
+        cid = self._ids.get(company)
+        if cid is None or self.companies[cid] is None:
+            return
+        bit = 1 << cid
+        self._live ^= bit
+        for key in self._keys[cid]:
+            if key in self._bits:
+                remaining = self._bits[key] = self._bits[key] ^ bit
+            else:
+                remaining = self._sparse[key]
+                remaining.discard(cid)
+            if not remaining:
+                self._bits.pop(key, None)
+                self._sparse.pop(key, None)
+                del self._labels[key]
+        self._keys[cid] = ()
+        self.companies[cid] = None
+
+    def reload(self, stocks=None):
+        """Rebuild every posting list from scratch (after direct edits to ENRICHED_STOCKS)."""
+        self.__init__(stocks)
+
+    def on_change(self, name, old_tags, new_tags):
+        """stock_enrichment listener: apply a single edit incrementally.
+
+        Only the posting lists of the company's old and new tags are touched.
+        """
+        if new_tags is None:
+            self.remove(name)
+        else:
+            self.add(name, new_tags)
+
+    def bits(self, tag):
+        """Bitset of companies carrying a tag."""
+        key = tag.upper()
+        bits = self._bits.get(key)
+        if bits is not None:
+            return bits
+        bits = 0
+        for cid in self._sparse.get(key, ()):
+            bits |= 1 << cid
+        return bits
+
+    def match(self, all_of=(), any_of=(), none_of=()):
+        """Bitset for companies with every all_of tag, at least one any_of tag
+        and no none_of tag. Empty all_of/any_of place no constraint."""
+        result = self._live
+        for tag in all_of:
+            result &= self.bits(tag)
+        if any_of:
+            union = 0
+            for tag in any_of:
+                union |= self.bits(tag)
+            result &= union
+        for tag in none_of:
+            result &= ~self.bits(tag)
+        return result
+
+    def ids_for(self, bits):
+        """Company ids set in a bitset, ascending (one pass over its bytes)."""
+        ids = []
+        for i, byte in enumerate(bits.to_bytes((bits.bit_length() + 7) >> 3, "little")):
+            while byte:
+                low = byte & -byte
+                ids.append((i << 3) + low.bit_length() - 1)
+                byte ^= low
+        return ids
+
+    def companies_for(self, bits):
+        """Company names for a bitset, in id (definition) order."""
+        companies = self.companies
+        return [companies[cid] for cid in self.ids_for(bits)]
+
+    def query(self, all_of=(), any_of=(), none_of=()):
+        """Company names matching an AND/OR/NOT tag query."""
+        return self.companies_for(self.match(all_of, any_of, none_of))
+
+    def count(self, all_of=(), any_of=(), none_of=()):
+        """Number of companies matching an AND/OR/NOT tag query."""
+        return self.match(all_of, any_of, none_of).bit_count()
+
+    def co_occurring(self, tag, top=10):
+        """Most frequent other tags among companies carrying tag, as (tag, count)."""
+        key = tag.upper()
+        base = self.bits(key)
+        counts = []
+        if base:
+            for other, bits in self._bits.items():
+                if other != key:
+                    n = (bits & base).bit_count()
+                    if n:
+                        counts.append((self._labels[other], n))
+            base_ids = set(self.ids_for(base))
+            for other, ids in self._sparse.items():
+                if other != key:
+                    n = len(ids & base_ids)
+                    if n:
+                        counts.append((self._labels[other], n))
+        counts.sort(key=lambda item: (-item[1], item[0]))
+        return counts[:top]
+
+
+_INDEX = None
+
+
+def get_index():
+    """Shared TagIndex over ENRICHED_STOCKS, built on first use and kept
+    current through stock_enrichment.set_stock/remove_stock and touch()."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = TagIndex()
+        stock_enrichment.add_listener(_INDEX.on_change)
+        stock_enrichment.add_reset_hook(_INDEX.reload)
+    return _INDEX
+
+
+def query(all_of=(), any_of=(), none_of=()):
+    """Companies matching a tag query, e.g. query(["Uranium", "Mining"], none_of=["Canada"])."""
+    return get_index().query(all_of, any_of, none_of)
+
+
+def count(all_of=(), any_of=(), none_of=()):
+    """Number of companies matching a tag query."""
+    return get_index().count(all_of, any_of, none_of)
+
+
+def co_occurring(tag, top=10):
+    """Top tags co-occurring with tag across ENRICHED_STOCKS."""
+    return get_index().co_occurring(tag, top)
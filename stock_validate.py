@@ -0,0 +1,204 @@
+"""
+Consistency checks across stock_enrichment.py, stock_symbols.json and the
+stock_database metadata.
+Every source is hashed once and cross-joined in a single pass, so the checks
+stay linear in the number of records and can run in CI or during ingest.
+--fix writes stock_symbols.json back without duplicate entries.
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import namedtuple
+
+import stock_enrichment
+import stock_records
+
+METADATA_DIR = os.path.join(stock_records.BASE_DIR, "stock_database", "metadata")
+SCHEMA_FILE = os.path.join(METADATA_DIR, "schema.json")
+DATA_SOURCES_FILE = os.path.join(METADATA_DIR, "data_sources.json")
+
+Issue = namedtuple("Issue", ["severity", "kind", "subject", "detail"])
+
+ERROR = "error"
+WARNING = "warning"
+
+# A tag outside categories.json is reported once this many companies share
+# it: it is acting as a theme the taxonomy is missing. Rarer tags are the
+# company's own free-form keywords (the schema's "keywords" field) and are
+# not checked.
+UNKNOWN_TAG_MIN = 3
+
+_JSON_TYPES = {
+    "string": str,
+    "array": list,
+    "object": dict,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+}
+
+
+def load_schema(path=SCHEMA_FILE):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["stock_schema"]
+
+
+def check_schema(record, schema):
+    """Yield problems for one record against the (subset of) JSON Schema we use."""
+    for field in schema.get("required", ()):
+        if field not in record or record[field] in ("", None):
+            yield f"missing required field {field!r}"
+    for field, value in record.items():
+        spec = schema["properties"].get(field)
+        if spec is None:
+            continue
+        if not isinstance(value, _JSON_TYPES[spec["type"]]):
+            yield f"{field!r} should be {spec['type']}"
+        elif spec["type"] == "array":
+            item_type = _JSON_TYPES[spec["items"]["type"]]
+            if not all(isinstance(item, item_type) for item in value):
+                yield f"{field!r} items should be {spec['items']['type']}"
+
+
+def dedupe_symbols(symbols):
+    """Split symbol entries into (first occurrences, exact repeats), order kept."""
+    seen, unique, duplicates = set(), [], []
+    for stock in symbols:
+        key = (stock["title"], stock["exchange"], stock["symbol"])
+        if key in seen:
+            duplicates.append(stock)
+        else:
+            seen.add(key)
+            unique.append(stock)
+    return unique, duplicates
+
+
+def dedupe_symbols_file(path=stock_enrichment.SYMBOLS_FILE, output=None):
+    """Write stock_symbols.json without exact repeats (in place by default);
+    return the number of entries dropped."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    unique, duplicates = dedupe_symbols(data["stocks"])
+    if duplicates or output not in (None, path):
+        data["stocks"] = unique
+        data["metadata"]["total_stocks"] = len(unique)
+        output = output or path
+        tmp = output + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, indent=2, ensure_ascii=False))
+        os.replace(tmp, output)
+    return len(duplicates)
+
+
+def validate(stocks, symbols, categories, schema, expected_counts=None):
+    """Return a list of Issues for an enriched stock dict and a symbol list.
+
+    stocks: {company: tags}, symbols: [{"title", "exchange", "symbol"}],
+    categories: parsed categories.json, expected_counts: optional
+    {"stock_enrichment.py": n, "stock_symbols.json": m}.
+    """
+    issues = []
+    canonical = {}
+    for category in categories["categories"].values():
+        for tag in category["tags"]:
+            canonical[tag.upper()] = tag
+    for tag in categories["geographic"]["tags"]:
+        canonical[tag.upper()] = tag
+
+    # Single pass over the enriched data: names, raw codes and tag spelling
+    names = {}
+    code_owners = {}
+    for company, tags in stocks.items():
+        names.setdefault(company.upper(), company)
+        for tag in tags:
+            code_owners.setdefault(tag, []).append(company)
+            spelled = canonical.get(tag.upper())
+            if spelled is not None and spelled != tag:
+                issues.append(Issue(WARNING, "noncanonical_tag", company,
+                                    f"{tag!r} should be spelled {spelled!r}"))
+
+    for tag, owners in code_owners.items():
+        if len(owners) >= UNKNOWN_TAG_MIN and tag.upper() not in canonical:
+            issues.append(Issue(WARNING, "unknown_tag", tag,
+                                f"used by {len(owners)} companies but not in metadata/categories.json"))
+
+    # Structured records: schema and primary-ticker uniqueness
+    store = stock_records.RecordStore(stocks)
+    by_ticker = {}
+    for record in store:
+        for problem in check_schema(record.to_dict(), schema):
+            issues.append(Issue(ERROR, "schema", record.company_name, problem))
+        if not record.tag_ids:
+            issues.append(Issue(WARNING, "no_category_tag", record.company_name,
+                                "no tag from metadata/categories.json"))
+        if record.ticker:
+            by_ticker.setdefault(record.ticker.upper(), []).append(record.company_name)
+    for ticker, companies in by_ticker.items():
+        if len(companies) > 1:
+            issues.append(Issue(ERROR, "duplicate_ticker", ticker,
+                                f"primary ticker of {', '.join(companies)}"))
+
+    # Single pass over stock_symbols.json, joined on symbol and title
+    unique, duplicates = dedupe_symbols(symbols)
+    for stock in duplicates:
+        issues.append(Issue(WARNING, "duplicate_symbol_entry", stock["title"],
+                            f"{stock['symbol']} listed more than once"))
+    symbol_titles = {}
+    for stock in unique:
+        title, symbol = stock["title"], stock["symbol"]
+        other = symbol_titles.setdefault(symbol, title)
+        if other != title:
+            issues.append(Issue(ERROR, "symbol_conflict", symbol,
+                                f"used for both {other!r} and {title!r}"))
+
+        company = names.get(title.upper())
+        owners = code_owners.get(symbol, ())
+        if company is not None and symbol not in stocks[company]:
+            issues.append(Issue(ERROR, "symbol_conflict", title,
+                                f"stock_symbols.json has {symbol}, stock_enrichment.py does not"))
+        elif company is None and owners and title not in owners:
+            issues.append(Issue(WARNING, "title_mismatch", symbol,
+                                f"{title!r} in stock_symbols.json, {', '.join(owners)} in stock_enrichment.py"))
+        elif company is None and not owners:
+            issues.append(Issue(WARNING, "orphan_symbol", title,
+                                f"{symbol} ({stock['exchange']}) has no enriched record"))
+
+    for source, expected in (expected_counts or {}).items():
+        actual = len(stocks) if source == "stock_enrichment.py" else len(symbols)
+        if actual != expected:
+            issues.append(Issue(WARNING, "count_mismatch", source,
+                                f"data_sources.json says {expected}, found {actual}"))
+    return issues
+
+
+def validate_repository():
+    """Validate the checked-in sources against the metadata."""
+    with open(stock_enrichment.SYMBOLS_FILE, encoding="utf-8") as f:
+        symbols = json.load(f)["stocks"]
+    with open(stock_records.CATEGORIES_FILE, encoding="utf-8") as f:
+        categories = json.load(f)
+    with open(DATA_SOURCES_FILE, encoding="utf-8") as f:
+        sources = json.load(f)["sources"]
+    expected = {name: source["record_count"] for name, source in sources.items()}
+    return validate(stock_enrichment.ENRICHED_STOCKS, symbols, categories, load_schema(), expected)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate the stock data sources.")
+    parser.add_argument("--strict", action="store_true", help="fail on warnings too")
+    parser.add_argument("--fix", nargs="?", const=stock_enrichment.SYMBOLS_FILE, metavar="PATH",
+                        help="write stock_symbols.json without duplicate entries (in place by default)")
+    args = parser.parse_args()
+
+    if args.fix:
+        dropped = dedupe_symbols_file(output=args.fix)
+        print(f"Dropped {dropped} duplicate symbol entr{'y' if dropped == 1 else 'ies'} -> {args.fix}\n")
+
+    issues = validate_repository()
+    for issue in sorted(issues, key=lambda i: (i.severity, i.kind, i.subject)):
+        print(f"{issue.severity.upper():7} {issue.kind:22} {issue.subject}: {issue.detail}")
+    errors = sum(issue.severity == ERROR for issue in issues)
+    print(f"\n{errors} error(s), {len(issues) - errors} warning(s)")
+    sys.exit(1 if errors or (args.strict and issues) else 0)
@@ -0,0 +1,101 @@
+import math
+from array import array
+
+import pytest
+
+import calculator
+
+
+@pytest.fixture(params=["array", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test on the array("d") fallback and, when installed, on NumPy."""
+    np = pytest.importorskip("numpy") if request.param == "numpy" else None
+    monkeypatch.setattr(calculator, "np", np)
+    return request.param
+
+
+def floats(values):
+    return [float(x) for x in values]
+
+
+def same(actual, expected):
+    actual = floats(actual)
+    return len(actual) == len(expected) and all(
+        (math.isnan(a) and math.isnan(e)) or a == pytest.approx(e) for a, e in zip(actual, expected))
+
+
+def test_get_average_rejects_empty_input():
+    assert calculator.get_average([1, 2, 3]) == 2
+    with pytest.raises(ValueError):
+        calculator.get_average([])
+
+
+def test_as_array_reads_float64_buffers(backend):
+    buffer = array("d", [1.5, 2.5]).tobytes()
+    assert floats(calculator.as_array(buffer)) == [1.5, 2.5]
+    assert floats(calculator.as_array(memoryview(buffer))) == [1.5, 2.5]
+
+
+def test_divide_arrays_zero_policies(backend):
+    a, b = [1.0, 4.0, 9.0], [1.0, 0.0, 3.0]
+    assert same(calculator.divide_arrays(a, b), [1.0, math.nan, 3.0])
+    assert same(calculator.divide_arrays(a, b, on_zero=-1), [1.0, -1.0, 3.0])
+    with pytest.raises(ValueError):
+        calculator.divide_arrays(a, b, on_zero="raise")
+    assert same(calculator.divide_arrays(a, [1.0, 2.0, 3.0], on_zero="raise"), [1.0, 2.0, 3.0])
+
+
+def test_divide_arrays_broadcasts_scalars(backend):
+    assert same(calculator.divide_arrays([2.0, 4.0], 2), [1.0, 2.0])
+    assert same(calculator.divide_arrays(12, [3.0, 0.0]), [4.0, math.nan])
+    assert same(calculator.divide_arrays(array("d", [6.0]), array("d", [3.0])), [2.0])
+
+
+def test_divide_arrays_rejects_shape_mismatch(backend):
+    with pytest.raises(ValueError):
+        calculator.divide_arrays([1.0, 2.0, 3.0], [1.0, 2.0])
+
+
+def test_zero_divisor_mask(backend):
+    assert [bool(x) for x in calculator.zero_divisor_mask([1.0, 0.0, -0.0, 2.0])] == [False, True, True, False]
+
+
+def test_discount_array(backend):
+    assert same(calculator.discount_array([100.0, 50.0], 10), [90.0, 45.0])
+    assert same(calculator.discount_array([100.0, 50.0], [10, 50]), [90.0, 25.0])
+    assert same(calculator.discount_array([80.0], 25), [calculator.calculate_discount(80.0, 25)])
+
+
+def test_average_array_treats_a_number_as_one_value(backend):
+    assert calculator.average_array(5) == 5.0
+    assert calculator.average_array(2.5) == 2.5
+
+
+def test_average_array_empty(backend):
+    assert math.isnan(calculator.average_array([]))
+    assert calculator.average_array([], empty=0.0) == 0.0
+    with pytest.raises(ValueError):
+        calculator.average_array([], empty="raise")
+
+
+def test_running_mean_matches_batched_mean(backend):
+    values = [float(i % 17) - 3.5 for i in range(1000)]
+    running = calculator.RunningMean()
+    for start in range(0, len(values), 64):
+        running.update(values[start:start + 64])
+    running.update(4.0)
+    running.add(-2.0)
+    values += [4.0, -2.0]
+    mean = sum(values) / len(values)
+    assert running.count == len(values)
+    assert running.mean == pytest.approx(mean)
+    assert running.variance == pytest.approx(sum((x - mean) ** 2 for x in values) / len(values))
+    assert calculator.stream_average([values[:10], values[10:]]) == pytest.approx(mean)
+
+
+def test_running_mean_merges_shards(backend):
+    left, right = calculator.RunningMean([1.0, 2.0, 3.0]), calculator.RunningMean([10.0])
+    merged = left.merge(right)
+    assert (merged.count, merged.mean) == (4, 4.0)
+    assert math.isnan(calculator.RunningMean().variance)
+    assert math.isnan(calculator.stream_average([[], []]))
@@ -0,0 +1,51 @@
+import pytest
+
+import stock_cache
+import stock_enrichment
+import stock_fuzzy
+import stock_records
+import stock_rollups
+import stock_tags
+
+NAME = "Quillfeather Robotics"
+
+
+@pytest.fixture
+def direct_edit():
+    """Add a company straight into ENRICHED_STOCKS, bypassing set_stock."""
+    # build every shared cache first, so they all hold the old data
+    stock_records.get_store()
+    stock_tags.get_index()
+    stock_fuzzy.get_index()
+    stock_rollups.get_rollups()
+    stock_cache.get_payload("csv")
+    stock_enrichment.ENRICHED_STOCKS[NAME] = {"QFR", "Robotics", "Feather Drones"}
+    yield
+    del stock_enrichment.ENRICHED_STOCKS[NAME]
+    stock_cache.invalidate()
+
+
+def test_invalidate_refreshes_every_shared_cache(direct_edit):
+    version = stock_enrichment.dataset_version()
+    stock_cache.invalidate()
+    assert stock_enrichment.dataset_version() > version
+    assert stock_enrichment.lookup("QFR") == (NAME,)
+    assert stock_records.get_store().get(NAME).ticker == "QFR"
+    assert NAME in stock_tags.query(["Robotics"])
+    assert [m.company for m in stock_fuzzy.fuzzy_lookup("Quilfeather Robotics")] == [NAME]
+    rollups = stock_rollups.get_rollups()
+    category = (stock_records.get_store().get(NAME).categories or (stock_rollups.OTHER,))[0]
+    assert NAME in rollups.companies_in(category)
+    assert rollups.summary()["companies"] == len(stock_enrichment.ENRICHED_STOCKS)
+    assert NAME.encode() in stock_cache.get_payload("csv").body
+    assert NAME.encode() in stock_cache.get_payload("json").body
+
+
+def test_invalidate_after_undoing_the_edit_drops_the_company(direct_edit):
+    stock_cache.invalidate()
+    del stock_enrichment.ENRICHED_STOCKS[NAME]
+    stock_cache.invalidate()
+    stock_enrichment.ENRICHED_STOCKS[NAME] = set()  # for the fixture's teardown
+    assert stock_records.get_store().get(NAME) is None
+    assert NAME not in stock_tags.query(["Robotics"])
+    assert stock_rollups.get_rollups().summary()["companies"] == len(stock_enrichment.ENRICHED_STOCKS) - 1
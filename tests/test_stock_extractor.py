@@ -0,0 +1,84 @@
+import stock_extractor
+
+STOCKS = {
+    "Nvidia": {"NVDA", "AI", "GPU"},
+    "Microsoft": {"MSFT", "AI", "Cloud"},
+    "Tesla": {"TSLA", "EV", "Model Y", "Robotaxi"},
+    "Rivian": {"RIVN", "EV"},
+    "Unity Software": {"U", "Gaming"},
+    "Sprott Physical Uranium": {"U.U", "Uranium Trust"},
+    "LSEG": {"LSEG", "Microsoft"},
+    "enCore Energy": {"EU", "Uranium"},
+    "IP Group": {"IPO", "Venture Capital"},
+    "Apple": {"AAPL", "iPhone"},
+    "Zoom": {"ZM"},
+    "Meta": {"META"},
+}
+
+
+def scan(text):
+    matcher = stock_extractor.StockMatcher(STOCKS)
+    return [(m.company, m.alias, m.offset) for m in matcher.scan(text)]
+
+
+def test_names_match_case_insensitively():
+    assert scan("bought more nvidia today") == [("Nvidia", "Nvidia", 12)]
+
+
+def test_codes_match_only_as_written_or_as_cashtag():
+    assert scan("tsla is up") == []
+    assert scan("TSLA is up") == [("Tesla", "TSLA", 0)]
+    assert scan("$tsla is up") == [("Tesla", "TSLA", 1)]
+
+
+def test_matches_respect_word_boundaries():
+    assert scan("THE EVENT IS LIVE") == []
+    assert scan("NVDAX and xNVDA") == []
+    assert scan("NVDA, then MSFT.") == [("Nvidia", "NVDA", 0), ("Microsoft", "MSFT", 11)]
+
+
+def test_dotted_tokens_do_not_leak_short_codes():
+    assert scan("the U.S. market") == []
+    assert scan("U.U is cheap") == [("Sprott Physical Uranium", "U.U", 0)]
+    assert scan("long $U here") == [("Unity Software", "U", 6)]
+
+
+def test_common_word_codes_only_count_as_cashtags():
+    assert scan("EU approvals ahead of the IPO, then a U-turn") == []
+    assert scan("$EU and $ipo") == [("enCore Energy", "EU", 1), ("IP Group", "IPO", 9)]
+
+
+def test_common_word_names_must_be_capitalised():
+    assert scan("apple pie, a zoom call and a meta analysis") == []
+    assert scan("Apple and Zoom beat; Meta too") == [
+        ("Apple", "Apple", 0), ("Zoom", "Zoom", 10), ("Meta", "Meta", 21)]
+    assert scan("bought more APPLE") == [("Apple", "Apple", 12)]
+    assert scan("nvidia and iphone") == [("Nvidia", "Nvidia", 0), ("Apple", "iPhone", 11)]
+
+
+def test_shared_tags_are_themes_not_mentions():
+    assert scan("AI and EV stocks") == []
+    assert scan("Model Y deliveries") == [("Tesla", "Model Y", 0)]
+
+
+def test_plain_one_word_keywords_are_themes():
+    assert scan("Robotaxi launch and Gaming") == []
+
+
+def test_another_companys_name_resolves_to_that_company():
+    assert scan("Microsoft earnings") == [("Microsoft", "Microsoft", 0)]
+
+
+def test_longest_match_wins_over_contained_alias():
+    assert scan("Uranium Trust inflows") == [("Sprott Physical Uranium", "Uranium Trust", 0)]
+
+
+def test_parallel_extraction_matches_streaming_counts(tmp_path):
+    path = tmp_path / "chat.txt"
+    lines = [f"[0{i % 9 + 1}/01/2025, 10:00:0{i % 10}] a: NVDA and $tsla, Nvidia\n" for i in range(200)]
+    path.write_text("".join(lines), encoding="utf-8")
+    matcher = stock_extractor.StockMatcher(STOCKS)
+    expected = stock_extractor.count_mentions(stock_extractor.extract_file(str(path), matcher))
+    stats = stock_extractor.extract_parallel(str(path), workers=1, stocks=STOCKS)
+    assert {company: entry[0] for company, entry in stats.items()} == dict(expected)
+    assert stats["Nvidia"][1] == "2025-01-01T10:00:00"
@@ -0,0 +1,43 @@
+import pytest
+
+import stock_enrichment
+import stock_fuzzy
+
+
+@pytest.mark.parametrize("text, company", [
+    ("Nvidea", "Nvidia"),
+    ("Microsft", "Microsoft"),
+    ("Palantr", "Palantir"),
+    ("super micro", "Super Micro Computer"),
+])
+def test_misspellings_resolve_to_one_company(text, company):
+    matches = stock_fuzzy.fuzzy_lookup(text)
+    assert [match.company for match in matches] == [company]
+    assert matches[0].score < 1.0
+
+
+def test_exact_name_scores_one():
+    assert stock_fuzzy.fuzzy_lookup(" tesla ") == [stock_fuzzy.FuzzyMatch("Tesla", "tesla", 1.0)]
+
+
+@pytest.mark.parametrize("theme", ["cloud", "AI", "Mining", "EV"])
+def test_shared_themes_match_nothing(theme):
+    assert len(stock_enrichment.lookup(theme)) > 1
+    assert stock_fuzzy.fuzzy_lookup(theme) == []
+
+
+def test_threshold_cuts_off_weak_matches():
+    score = stock_fuzzy.fuzzy_lookup("Microsft")[0].score
+    assert stock_fuzzy.fuzzy_lookup("Microsft", threshold=score + 0.01) == []
+    assert stock_fuzzy.fuzzy_lookup("Zzyzx Qwrtp") == []
+
+
+def test_index_follows_set_stock():
+    name = "Quillfeather Robotics"
+    assert stock_fuzzy.fuzzy_lookup("Quilfeather Robotics") == []
+    stock_enrichment.set_stock(name, {"QFR", "Robotics"})
+    try:
+        assert [m.company for m in stock_fuzzy.fuzzy_lookup("Quilfeather Robotics")] == [name]
+    finally:
+        stock_enrichment.remove_stock(name)
+    assert stock_fuzzy.fuzzy_lookup("Quilfeather Robotics") == []
@@ -0,0 +1,126 @@
+import asyncio
+import json
+
+import pytest
+
+import stock_enrichment
+import stock_import
+
+
+@pytest.fixture
+def restore_stocks():
+    before = {name: set(tags) for name, tags in stock_enrichment.ENRICHED_STOCKS.items()}
+    yield
+    for name in list(stock_enrichment.ENRICHED_STOCKS):
+        if name not in before:
+            stock_enrichment.remove_stock(name)
+    for name, tags in before.items():
+        if stock_enrichment.ENRICHED_STOCKS.get(name) != tags:
+            stock_enrichment.set_stock(name, tags)
+
+
+def write_jsonl(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    return stock_import.FileSource(str(path), "test")
+
+
+def run(sources, **kwargs):
+    return asyncio.run(asyncio.wait_for(stock_import.run_import(sources, **kwargs), timeout=10))
+
+
+def collect(path):
+    async def read():
+        return [record async for record in stock_import.iter_json_records(str(path))]
+    return asyncio.run(read())
+
+
+RECORDS = [{"title": f"Test Co {i}", "symbol": f"TST{i}", "tags": "Alpha, Beta", "price": 1.25 * i}
+           for i in range(50)]
+
+
+@pytest.mark.parametrize("layout", ["jsonl", "array", "stocks", "records"])
+@pytest.mark.parametrize("chunk_size", [7, 1 << 16])
+def test_records_stream_from_every_layout(tmp_path, monkeypatch, layout, chunk_size):
+    monkeypatch.setattr(stock_import, "CHUNK_SIZE", chunk_size)
+    if layout == "jsonl":
+        path = tmp_path / "export.jsonl"
+        path.write_text("".join(json.dumps(record) + "\n" for record in RECORDS), encoding="utf-8")
+    else:
+        path = tmp_path / "export.json"
+        data = RECORDS if layout == "array" else {
+            "metadata": {"total_stocks": len(RECORDS), "exchanges": ["NYSE", "LON"]}, layout: RECORDS}
+        path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+    assert collect(path) == RECORDS
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".json"])
+def test_undecodable_records_are_rejected_one_by_one(restore_stocks, tmp_path, monkeypatch, suffix):
+    monkeypatch.setattr(stock_import, "CHUNK_SIZE", 5)
+    good = [json.dumps({"company": f"Decode Co {i}", "symbol": f"DEC{i}", "tags": ["Widgets"]})
+            for i in range(3)]
+    bad = ['{"company": "Broken Co", "symbol": }', '{"company": "Also, Broken" "tags": ["x"]}']
+    lines = [good[0], bad[0], good[1], bad[1], good[2]]
+    path = tmp_path / f"mixed{suffix}"
+    if suffix == ".jsonl":
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    else:
+        path.write_text("[\n" + ",\n".join(lines) + "\n]", encoding="utf-8")
+    stats = run([stock_import.FileSource(str(path), "test")])
+    assert (stats.records, stats.merged, stats.rejected) == (5, 3, 2)
+    assert {f"Decode Co {i}" for i in range(3)} <= set(stock_enrichment.ENRICHED_STOCKS)
+
+
+@pytest.mark.parametrize("text", ['"just a string"', "42", "", '[{"title": "Cut Co"}, {"tit'])
+def test_unusable_files_count_as_one_rejection(tmp_path, text):
+    path = tmp_path / "odd.json"
+    path.write_text(text, encoding="utf-8")
+    records = collect(path)
+    assert isinstance(records[-1], stock_import.Malformed)
+    assert sum(isinstance(record, stock_import.Malformed) for record in records) == 1
+
+
+def test_merge_adds_tags_and_ticker(restore_stocks, tmp_path):
+    source = write_jsonl(tmp_path / "new.jsonl", [
+        {"company": "Importer Test Co", "symbol": "IMPT", "exchange": "NASDAQ", "tags": ["Widgets"]},
+        {"name": "Importer Test Co", "ticker": "IMPT", "keywords": "Gadgets, Gizmos"},
+    ])
+    stats = run([source], queue_size=1)
+    assert (stats.records, stats.merged, stats.rejected) == (2, 2, 0)
+    assert stock_enrichment.ENRICHED_STOCKS["Importer Test Co"] == {"IMPT", "Widgets", "Gadgets", "Gizmos"}
+
+
+def test_malformed_records_are_rejected(restore_stocks, tmp_path):
+    source = write_jsonl(tmp_path / "bad.jsonl", [
+        {"company": "Bad Tags Co", "symbol": "BTC1", "tags": 5},
+        {"company": "Bad Items Co", "symbol": "BIC1", "tags": [{"nested": True}]},
+        {"symbol": "NONAME"},
+        ["not", "a", "record"],
+        {"company": "Good Co", "symbol": "GOOD1", "tags": ["Widgets"]},
+    ])
+    stats = run([source])
+    assert (stats.records, stats.merged, stats.rejected) == (5, 1, 4)
+    assert "Bad Tags Co" not in stock_enrichment.ENRICHED_STOCKS
+    assert "Good Co" in stock_enrichment.ENRICHED_STOCKS
+
+
+def test_listener_error_stops_the_import_after_every_listener_ran(restore_stocks, tmp_path):
+    seen = []
+
+    def explode(name, old_tags, new_tags):
+        raise RuntimeError("listener failed")
+
+    def record(name, old_tags, new_tags):
+        seen.append(name)
+
+    records = [{"company": f"Listener Co {i}", "symbol": f"LST{i}", "tags": ["Widgets"]} for i in range(20)]
+    source = write_jsonl(tmp_path / "listener.jsonl", records)
+    stock_enrichment.add_listener(explode)
+    stock_enrichment.add_listener(record)
+    try:
+        with pytest.raises(RuntimeError, match="listener failed"):
+            run([source], queue_size=2)
+    finally:
+        stock_enrichment.remove_listener(explode)
+        stock_enrichment.remove_listener(record)
+    imported = [name for name in stock_enrichment.ENRICHED_STOCKS if name.startswith("Listener Co")]
+    assert imported == seen == ["Listener Co 0"]
@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import stock_metrics
+import stock_rollups
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = sorted(name[:-3] for name in os.listdir(ROOT) if name.endswith(".py"))
+
+
+# Imports `module` first, then opts in through the environment the way an
+# entry point does, and checks a hot path really is timed
+OPT_IN = """
+import {module}
+import stock_metrics
+assert not stock_metrics.enabled(), "enabled at import time"
+assert stock_metrics.init() is {expected}
+import stock_enrichment
+stock_enrichment.get_stock("Tesla")
+timings = stock_metrics.snapshot()["timings"]
+assert timings.get("stock_enrichment.get_stock", {{}}).get("calls") == ({expected} or None), timings
+"""
+
+
+def run_probe(module, env_value):
+    env = dict(os.environ)
+    env.pop(stock_metrics.ENV_VAR, None)
+    if env_value is not None:
+        env[stock_metrics.ENV_VAR] = env_value
+    code = OPT_IN.format(module=module, expected=env_value == "1")
+    # a fresh interpreter per module, so import order cannot hide a cycle
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True)
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_env_opt_in_times_hot_paths_after_importing(module):
+    result = run_probe(module, "1")
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("env_value", [None, "0"])
+def test_init_leaves_metrics_off_without_opt_in(env_value):
+    result = run_probe("stock_enrichment", env_value)
+    assert result.returncode == 0, result.stderr
+
+
+def test_rollups_serve_metrics_only_when_enabled():
+    assert stock_rollups.route("/metrics") is None
+    stock_metrics.enable()
+    try:
+        stock_rollups.route("/summary")
+        assert "timings" in stock_rollups.route("/metrics")
+    finally:
+        stock_metrics.disable()
+        stock_metrics.reset()
+
+
+def test_enable_wraps_and_disable_restores():
+    import stock_cache
+    import stock_enrichment
+    import stock_metrics
+
+    original = stock_enrichment.get_stock
+    stock_metrics.reset()
+    stock_metrics.enable()
+    try:
+        assert stock_metrics.enabled()
+        stock_enrichment.get_stock("Tesla")
+        stock_cache.invalidate()
+        stock_cache.get_payload("json")
+    finally:
+        stock_metrics.disable()
+    assert stock_enrichment.get_stock is original
+    snapshot = stock_metrics.snapshot()
+    assert snapshot["timings"]["stock_enrichment.get_stock"]["calls"] == 1
+    assert snapshot["counters"]["stock_cache.render.json"] == 1
+    stock_metrics.reset()
@@ -0,0 +1,58 @@
+import random
+
+import stock_enrichment
+import stock_records
+
+
+def snapshot(store):
+    records = [record.to_dict() for record in store]
+    tickers = {record.ticker: store.by_ticker(record.ticker).company_name
+               for record in store if record.ticker}
+    return records, tickers
+
+
+def test_shared_ticker_goes_to_the_first_company():
+    stocks = {"Valterra": {"VAL", "Platinum"}, "Valaris": {"VAL", "Offshore"}}
+    store = stock_records.RecordStore(stocks)
+    assert store.by_ticker("val").company_name == "Valterra"
+    store.remove("Valterra")
+    assert store.by_ticker("VAL").company_name == "Valaris"
+
+
+def test_listings_follow_the_ticker_owner():
+    stocks = {"NuScale": {"SMR"}, "Oklo": {"OKLO", "SMR"}}
+    store = stock_records.RecordStore(stocks)
+    assert store.get("Oklo").listings == ()
+    store.remove("NuScale")
+    assert store.get("Oklo").listings == ("SMR",)
+    store.add("NuScale", {"SMR"})
+    assert store.get("Oklo").listings == ()
+
+
+def test_all_caps_code_is_a_ticker_not_a_category_tag():
+    stocks = {"SpaceX": {"SPACE", "Rockets"}, "Rocket Lab": {"RKLB", "Space"}, "Nvidia": {"NVDA", "AI"}}
+    store = stock_records.RecordStore(stocks)
+    spacex = store.get("SpaceX")
+    assert spacex.ticker == "SPACE"
+    assert "SPACE" not in spacex.tags
+    assert store.get("Rocket Lab").tags == ("Space",)
+    assert "space" in store.get("Rocket Lab").categories
+    assert store.get("Nvidia").ticker == "NVDA"
+    assert store.get("Nvidia").tags == ("AI",)
+
+
+def test_random_edits_match_a_fresh_build():
+    rng = random.Random(7)
+    stocks = {name: set(tags) for name, tags in stock_enrichment.ENRICHED_STOCKS.items()}
+    codes = sorted({tag for tags in stocks.values() for tag in tags if tag.isupper()})
+    store = stock_records.RecordStore(stocks)
+    for step in range(200):
+        company = rng.choice(list(stocks) + [f"New Co {step}"])
+        if company in stocks and rng.random() < 0.3:
+            del stocks[company]
+            store.on_change(company, None, None)
+        else:
+            tags = set(rng.sample(codes, rng.randint(0, 3)))
+            stocks[company] = tags
+            store.on_change(company, None, tags)
+        assert snapshot(store) == snapshot(stock_records.RecordStore(stocks)), step
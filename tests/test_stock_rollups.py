@@ -0,0 +1,24 @@
+import stock_records
+import stock_rollups
+
+
+def make_rollups():
+    stocks = {"Tesla": {"TSLA", "EV"}, "Rivian": {"RIVN", "EV"}}
+    return stock_rollups.Rollups(stock_records.RecordStore(stocks))
+
+
+def test_unknown_keys_are_not_cached():
+    rollups = make_rollups()
+    for i in range(100):
+        assert rollups.companies_in(f"no-such-category-{i}") == ()
+        assert rollups.companies_on(f"NOPE{i}") == ()
+    assert rollups._sorted == {}
+
+
+def test_cached_members_follow_edits():
+    rollups = make_rollups()
+    exchange = rollups.store.get("Tesla").exchange or stock_rollups.UNKNOWN
+    before = rollups.companies_on(exchange)
+    assert "Tesla" in before
+    rollups.remove("Tesla")
+    assert rollups.companies_on(exchange) == tuple(name for name in before if name != "Tesla")
@@ -0,0 +1,52 @@
+import json
+import random
+import shutil
+
+import pytest
+
+import stock_snapshots
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    sources = tmp_path / "data_sources.json"
+    shutil.copy(stock_snapshots.DATA_SOURCES_FILE, sources)
+    return tmp_path / "snapshots", sources
+
+
+def test_unchanged_data_records_no_version(snapshot_dir):
+    directory, sources = snapshot_dir
+    stocks = {"Tesla": {"TSLA", "EV"}}
+    assert stock_snapshots.take_snapshot(stocks, str(directory), str(sources))[0] == 1
+    assert stock_snapshots.take_snapshot(stocks, str(directory), str(sources)) == (1, None)
+    entry = json.loads(sources.read_text(encoding="utf-8"))["sources"][stock_snapshots.SOURCE_NAME]
+    assert entry["snapshot_version"] == 1
+
+
+def test_changes_since_every_version_reaches_the_latest(snapshot_dir):
+    directory, sources = snapshot_dir
+    rng = random.Random(11)
+    names = [f"Company {i}" for i in range(15)]
+    tags = list("ABCDEFGH")
+    stocks = {}
+    states = [{}]  # states[v] is the data at version v
+    for _ in range(60):
+        name = rng.choice(names)
+        if name in stocks and rng.random() < 0.25:
+            del stocks[name]
+        else:
+            stocks[name] = set(rng.sample(tags, rng.randint(0, 4)))
+        version, delta = stock_snapshots.take_snapshot(stocks, str(directory), str(sources))
+        if delta is not None:
+            states.append({name: set(value) for name, value in stocks.items()})
+        assert version == len(states) - 1
+
+    latest = states[-1]
+    for version, state in enumerate(states):
+        delta = stock_snapshots.changes_since(version, str(directory))
+        assert (delta["from"], delta["to"]) == (version, len(states) - 1)
+        patched = stock_snapshots.apply_changes({name: set(value) for name, value in state.items()}, delta)
+        assert patched == latest
+
+    with pytest.raises(ValueError):
+        stock_snapshots.changes_since(len(states), str(directory))
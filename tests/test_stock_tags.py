@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+import stock_tags
+
+TAGS = ["Uranium", "uranium", "Mining", "AI", "Cloud", "EV", "Gold", "Space", "Defence", "SaaS", "Chips", "UK"]
+
+
+def model_query(model, all_of=(), any_of=(), none_of=()):
+    """The same query over {company: upper-cased tags} with plain sets."""
+    matched = set()
+    for company, keys in model.items():
+        if not all(tag.upper() in keys for tag in all_of):
+            continue
+        if any_of and not any(tag.upper() in keys for tag in any_of):
+            continue
+        if any(tag.upper() in keys for tag in none_of):
+            continue
+        matched.add(company)
+    return matched
+
+
+@pytest.mark.parametrize("sparse_ratio", [1, 4, stock_tags.SPARSE_RATIO])
+def test_random_edits_match_set_queries(monkeypatch, sparse_ratio):
+    # small ratios move tags across the sparse/dense cut-over as they grow and shrink
+    monkeypatch.setattr(stock_tags, "SPARSE_RATIO", sparse_ratio)
+    rng = random.Random(sparse_ratio)
+    stocks = {f"Co {i}": set(rng.sample(TAGS, rng.randint(0, 4))) | {f"T{i}"} for i in range(40)}
+    index = stock_tags.TagIndex(stocks)
+    model = {company: {tag.upper() for tag in tags} for company, tags in stocks.items()}
+    for step in range(400):
+        company = f"Co {rng.randrange(60)}"
+        if company in model and rng.random() < 0.3:
+            index.remove(company)
+            del model[company]
+        else:
+            tags = set(rng.sample(TAGS, rng.randint(0, 5))) | {f"T{step}"}
+            index.add(company, tags)
+            model[company] = {tag.upper() for tag in tags}
+
+        if step % 20:
+            continue
+        for _ in range(10):
+            all_of = rng.sample(TAGS, rng.randint(0, 2))
+            any_of = rng.sample(TAGS, rng.randint(0, 3))
+            none_of = rng.sample(TAGS, rng.randint(0, 2))
+            expected = model_query(model, all_of, any_of, none_of)
+            assert set(index.query(all_of, any_of, none_of)) == expected
+            assert index.count(all_of, any_of, none_of) == len(expected)
+        tag = rng.choice(TAGS).upper()
+        base = [keys for keys in model.values() if tag in keys]
+        expected = {}
+        for keys in base:
+            for other in keys - {tag}:
+                expected[other] = expected.get(other, 0) + 1
+        assert {label.upper(): n for label, n in index.co_occurring(tag, top=1000)} == expected
+
+    fresh = stock_tags.TagIndex({company: model[company] for company in model})
+    assert set(fresh.query()) == set(index.query()) == set(model)
+
+
+def test_query_is_case_insensitive_and_in_definition_order():
+    index = stock_tags.TagIndex({"A": {"Uranium", "UK"}, "B": {"uranium"}, "C": {"Gold"}})
+    assert index.query(["URANIUM"]) == ["A", "B"]
+    assert index.query(any_of=["gold", "uk"]) == ["A", "C"]
+    assert index.query(none_of=["Uranium"]) == ["C"]
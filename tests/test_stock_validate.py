@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+import stock_records
+import stock_validate
+
+
+@pytest.fixture(scope="module")
+def metadata():
+    with open(stock_records.CATEGORIES_FILE, encoding="utf-8") as f:
+        categories = json.load(f)
+    return categories, stock_validate.load_schema()
+
+
+STOCKS = {
+    "Valterra": {"VAL", "Platinum", "Mining"},
+    "Valaris": {"VAL", "Offshore", "Oil & Gas"},
+    "Cameco": {"CCJ", "Uranium", "nuclear"},
+    "Oklo": {"OKLO", "Nuclear", "Widgets"},
+    "NuScale": {"SMR", "Nuclear", "Widgets"},
+    "Lightbridge": {"LTBR", "Nuclear", "Widgets"},
+}
+
+SYMBOLS = [
+    {"title": "Cameco", "exchange": "NYSE", "symbol": "CCJ"},
+    {"title": "Cameco", "exchange": "NYSE", "symbol": "CCJ"},
+    {"title": "Oklo", "exchange": "NYSE", "symbol": "OKLO"},
+    {"title": "Oklo Holdings", "exchange": "NYSE", "symbol": "OKLO"},
+    {"title": "NuScale", "exchange": "NYSE", "symbol": "SMRX"},
+    {"title": "Orphan Mining Co", "exchange": "LON", "symbol": "ORPH"},
+]
+
+
+def issues_by_kind(metadata, stocks=STOCKS, symbols=SYMBOLS, expected=None):
+    categories, schema = metadata
+    found = {}
+    for issue in stock_validate.validate(stocks, symbols, categories, schema, expected):
+        found.setdefault(issue.kind, []).append(issue)
+    return found
+
+
+def test_shared_primary_ticker_is_an_error(metadata):
+    [issue] = issues_by_kind(metadata)["duplicate_ticker"]
+    assert (issue.severity, issue.subject) == (stock_validate.ERROR, "VAL")
+    assert "Valterra, Valaris" in issue.detail
+
+
+def test_symbol_conflicts(metadata):
+    conflicts = {(issue.subject, issue.detail) for issue in issues_by_kind(metadata)["symbol_conflict"]}
+    assert ("OKLO", "used for both 'Oklo' and 'Oklo Holdings'") in conflicts
+    assert ("NuScale", "stock_symbols.json has SMRX, stock_enrichment.py does not") in conflicts
+
+
+def test_orphans_duplicates_and_spelling(metadata):
+    found = issues_by_kind(metadata)
+    assert [issue.subject for issue in found["orphan_symbol"]] == ["Orphan Mining Co"]
+    assert [issue.subject for issue in found["duplicate_symbol_entry"]] == ["Cameco"]
+    assert [issue.subject for issue in found["noncanonical_tag"]] == ["Cameco"]
+
+
+def test_unknown_tags_shared_by_several_companies(metadata):
+    found = issues_by_kind(metadata)
+    assert [issue.subject for issue in found["unknown_tag"]] == ["Widgets"]
+    fewer = {name: tags - {"Widgets"} if name == "Oklo" else tags for name, tags in STOCKS.items()}
+    assert "unknown_tag" not in issues_by_kind(metadata, stocks=fewer)
+
+
+def test_count_mismatch(metadata):
+    found = issues_by_kind(metadata, expected={"stock_enrichment.py": 6, "stock_symbols.json": 5})
+    assert [issue.subject for issue in found["count_mismatch"]] == ["stock_symbols.json"]
+
+
+def test_dedupe_symbols_file(tmp_path):
+    source = tmp_path / "symbols.json"
+    source.write_text(json.dumps({"metadata": {"total_stocks": len(SYMBOLS)}, "stocks": SYMBOLS}, indent=2),
+                      encoding="utf-8")
+    output = tmp_path / "deduped.json"
+    assert stock_validate.dedupe_symbols_file(str(source), str(output)) == 1
+    data = json.loads(output.read_text(encoding="utf-8"))
+    assert data["stocks"] == SYMBOLS[:1] + SYMBOLS[2:]
+    assert data["metadata"]["total_stocks"] == len(SYMBOLS) - 1
+    assert stock_validate.dedupe_symbols_file(str(output)) == 0